@@ -1,9 +1,10 @@
 # agents/hello_agent.py
-from datetime import datetime
-from typing import Any, Dict
+import logging
+import time
+from typing import Any, AsyncIterator, Dict
 from core.base_agent import BaseAgent
-from providers.llm_service_provider import get_llm_service
-from core.logger import log_info, log_error
+from providers.llm_service_provider import get_llm_service, get_llm_coalescer, get_llm_cache, llm_cache_key
+from core.logger import logger, log_info, log_debug, log_error
 
 class HelloAgent(BaseAgent):
     """
@@ -15,9 +16,15 @@ class HelloAgent(BaseAgent):
     name = "HelloAgent"
     description = "A minimal demo agent that calls Azure OpenAI to greet users."
 
-    def __init__(self, memory=None, tools=None):
+    _PROMPT_TMPL = "You are a friendly assistant. Reply to: '{query}' in a cheerful tone."
+    _REPLY_TMPL = "👋 Hello! You said: '{query}'.\nLLM says: {response}"
+
+    def __init__(self, memory=None, tools=None, llm=None):
         super().__init__(memory=memory, tools=tools)
-        self.llm = get_llm_service()
+        # An injected provider is called directly; the shared one goes through the coalescer.
+        self.llm = llm or get_llm_service()
+        self.coalescer = None if llm else get_llm_coalescer()
+        self.cache = get_llm_cache()
 
     # ---- optional hook overrides ----
     def pre_process(self, query: str, state: Dict[str, Any]) -> str:
@@ -38,18 +45,30 @@ class HelloAgent(BaseAgent):
         Execute the agent logic (LLM call + response formatting).
         This is the core async execution body.
         """
-        timestamp = datetime.utcnow().isoformat()
+        timestamp = time.time_ns()  # epoch nanoseconds (int)
         log_info(f"[{self.name}] running.", query=query)
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         try:
             # --- Call the LLM ---
-            prompt = f"You are a friendly assistant. Reply to: '{query}' in a cheerful tone."
-            log_info(f"[{self.name}] calling LLM...", prompt_preview=prompt[:80])
-            llm_response = await self.llm.apredict(prompt)
+            prompt = self._PROMPT_TMPL.format(query=query)
+            if debug:
+                log_debug(f"[{self.name}] calling LLM...", prompt_preview=prompt[:80])
+            cache_key = llm_cache_key(prompt)
+            llm_response = self.cache.get(cache_key)
+            if llm_response is None:
+                if self.coalescer:
+                    llm_response = await self.coalescer.submit(prompt)
+                else:
+                    llm_response = await self.llm.apredict(prompt)
+                self.cache.set(cache_key, llm_response)
+            elif debug:
+                log_debug(f"[{self.name}] LLM response served from cache.")
 
-            reply = f"👋 Hello! You said: '{query}'.\nLLM says: {llm_response}"
+            reply = self._REPLY_TMPL.format(query=query, response=llm_response)
 
-            log_info(f"[{self.name}] got LLM response.", llm_response=llm_response[:100])
+            if debug:
+                log_debug(f"[{self.name}] got LLM response.", llm_response=llm_response[:100])
             return {
                 "reply": reply,
                 "timestamp": timestamp,
@@ -63,3 +82,40 @@ class HelloAgent(BaseAgent):
                 "timestamp": timestamp,
                 "llm_used": False,
             }
+
+    async def stream_run(self, query: str, state: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of `run()`: yields `{"delta": ...}` chunks as the LLM
+        decodes, then the same final dict `run()` returns.
+        """
+        timestamp = time.time_ns()  # epoch nanoseconds (int)
+        log_info(f"[{self.name}] streaming.", query=query)
+
+        prompt = self._PROMPT_TMPL.format(query=query)
+        cache_key = llm_cache_key(prompt)
+        llm_response = self.cache.get(cache_key)
+
+        try:
+            if llm_response is not None:
+                yield {"delta": llm_response}
+            else:
+                pieces = []
+                async for text in self.llm.astream(prompt):
+                    pieces.append(text)
+                    yield {"delta": text}
+                llm_response = "".join(pieces)
+                self.cache.set(cache_key, llm_response)
+
+            yield {
+                "reply": self._REPLY_TMPL.format(query=query, response=llm_response),
+                "timestamp": timestamp,
+                "llm_used": True,
+            }
+
+        except Exception as e:
+            log_error(f"[{self.name}] LLM stream failed.", error=str(e))
+            yield {
+                "reply": f"👋 Hello! You said: '{query}', but LLM call failed: {str(e)}",
+                "timestamp": timestamp,
+                "llm_used": False,
+            }
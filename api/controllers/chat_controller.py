@@ -1,5 +1,8 @@
 import uuid
+import orjson
+from typing import AsyncIterator
 from orchestrator.orchestrator_provider import get_orchestrator_service
+from core.context import request_context
 from core.logger import log_info, log_error
 
 class ChatController:
@@ -21,25 +24,59 @@ class ChatController:
         # ---- Default domain ----
         domain = domain or "hello"
 
-        try:
-            # Pass domain to orchestrator
-            result = await self.orchestrator.handle_user_query(session_id, query, domain=domain)
-            log_info("Chat handled successfully.", session_id=session_id, domain=domain)
-
-            return {
-                "session_id": session_id,
-                "query": query,
-                "domain": domain,
-                "result": result,
-                "status": "success",
-            }
-
-        except Exception as e:
-            log_error("Error handling chat.", session_id=session_id, domain=domain, error=str(e))
-            return {
-                "session_id": session_id,
-                "query": query,
-                "domain": domain,
-                "error": str(e),
-                "status": "error",
-            }
+        # ---- Request-scoped logging context ----
+        with request_context(session_id=session_id, domain=domain, trace_id=uuid.uuid4().hex):
+            try:
+                # Pass domain to orchestrator
+                result = await self.orchestrator.handle_user_query(session_id, query, domain=domain)
+                log_info("Chat handled successfully.")
+
+                return {
+                    "session_id": session_id,
+                    "query": query,
+                    "domain": domain,
+                    "result": result,
+                    "status": "success",
+                }
+
+            except Exception as e:
+                log_error("Error handling chat.", error=str(e))
+                return {
+                    "session_id": session_id,
+                    "query": query,
+                    "domain": domain,
+                    "error": str(e),
+                    "status": "error",
+                }
+
+    async def handle_chat_stream(self, session_id: str | None, query: str, domain: str | None = None) -> AsyncIterator[bytes]:
+        """
+        Streaming variant of `handle_chat`, encoded as server-sent events.
+        Emits `delta` events while the agent decodes, then a single `done`
+        (or `error`) event carrying the same payload `handle_chat` returns.
+        """
+        if not session_id:
+            session_id = str(uuid.uuid4())
+            log_info("Generated new session_id.", session_id=session_id)
+
+        domain = domain or "hello"
+
+        with request_context(session_id=session_id, domain=domain, trace_id=uuid.uuid4().hex):
+            try:
+                async for chunk in self.orchestrator.stream_user_query(session_id, query, domain=domain):
+                    if "delta" in chunk:
+                        yield _sse("delta", {"delta": chunk["delta"]})
+                    elif chunk.get("status") == "error":
+                        yield _sse("error", {"session_id": session_id, "query": query, "domain": domain, "error": chunk.get("error"), "status": "error"})
+                    else:
+                        log_info("Chat stream handled successfully.")
+                        yield _sse("done", {"session_id": session_id, "query": query, "domain": domain, "result": chunk, "status": "success"})
+
+            except Exception as e:
+                log_error("Error handling chat stream.", error=str(e))
+                yield _sse("error", {"session_id": session_id, "query": query, "domain": domain, "error": str(e), "status": "error"})
+
+
+def _sse(event: str, data: dict) -> bytes:
+    """Encode one server-sent event frame."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
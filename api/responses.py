@@ -0,0 +1,14 @@
+# api/responses.py
+from typing import Any
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    """
+    JSON response rendered with orjson (faster than stdlib json, emits bytes directly).
+    Used as the app's default response class for routes that return plain dicts.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -1,19 +1,96 @@
 # app/api/routes/chat_route.py
-from fastapi import APIRouter
-from pydantic import BaseModel
+import re
+import msgspec
+from fastapi import APIRouter, Depends, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
 from api.controllers.chat_controller import ChatController
 
 router = APIRouter(prefix="/chat", tags=["Chat"])
 controller = ChatController()
 
-class ChatRequest(BaseModel):
-    session_id: str | None = None
+class ChatRequest(msgspec.Struct):
     query: str
+    session_id: str | None = None
     domain: str | None = None
 
-@router.post("/")
-async def chat_endpoint(request: ChatRequest):
+async def parse_chat_request(request: Request) -> ChatRequest:
+    """Decode and validate the JSON body in one C-level pass (msgspec)."""
+    body = await request.body()
+    try:
+        return msgspec.json.decode(body, type=ChatRequest)
+    except msgspec.DecodeError as e:  # ValidationError subclasses DecodeError
+        # Same 422 body FastAPI produces for Pydantic models: {"detail": [{type, loc, msg, input}]}
+        raise RequestValidationError(_validation_errors(e, body)) from e
+
+# msgspec error text -> FastAPI/Pydantic error entries (only parsed on the error path)
+_ERROR_PATH_RE = re.compile(r"\.([^.\[]+)|\[(\d+)\]")
+_MISSING_FIELD_RE = re.compile(r"^Object missing required field `(.+?)`")
+_EXPECTED_RE = re.compile(r"^Expected `([^`|]+)")
+_DECODE_POS_RE = re.compile(r"\(byte (\d+)\)")
+_TYPE_ERRORS = {
+    "str": ("string_type", "Input should be a valid string"),
+    "int": ("int_type", "Input should be a valid integer"),
+    "float": ("float_type", "Input should be a valid number"),
+    "bool": ("bool_type", "Input should be a valid boolean"),
+    "array": ("list_type", "Input should be a valid list"),
+    "object": ("model_attributes_type", "Input should be a valid dictionary or object to extract fields from"),
+}
+
+def _validation_errors(error: msgspec.DecodeError, body: bytes) -> list:
+    if not body:
+        return [{"type": "missing", "loc": ["body"], "msg": "Field required", "input": None}]
+    if not isinstance(error, msgspec.ValidationError):  # malformed JSON
+        pos = _DECODE_POS_RE.search(str(error))
+        return [{
+            "type": "json_invalid",
+            "loc": ["body", int(pos.group(1)) if pos else 0],
+            "msg": "JSON decode error",
+            "input": {},
+            "ctx": {"error": str(error)},
+        }]
+
+    message, _, path = str(error).partition(" - at `")
+    loc: list = ["body"]
+    value = msgspec.json.decode(body)  # valid JSON: only validation failed
+    for key, index in _ERROR_PATH_RE.findall(path.rstrip("`").removeprefix("$")):
+        part = int(index) if index else key
+        loc.append(part)
+        try:
+            value = value[part]
+        except (KeyError, IndexError, TypeError):
+            value = None
+
+    missing = _MISSING_FIELD_RE.match(message)
+    if missing:
+        return [{"type": "missing", "loc": loc + [missing.group(1)], "msg": "Field required", "input": value}]
+    expected = _EXPECTED_RE.match(message)
+    error_type, msg = _TYPE_ERRORS.get(expected.group(1).strip() if expected else "", ("value_error", message))
+    return [{"type": error_type, "loc": loc, "msg": msg, "input": value}]
+
+# The body is parsed outside FastAPI's model system, so publish its schema explicitly for /docs
+_, _components = msgspec.json.schema_components([ChatRequest])
+CHAT_REQUEST_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": _components["ChatRequest"]}},
+    }
+}
+
+@router.post("/", response_model=None, openapi_extra=CHAT_REQUEST_OPENAPI)
+async def chat_endpoint(request: ChatRequest = Depends(parse_chat_request)):
     """
     Chat endpoint to handle user queries.
     """
     return await controller.handle_chat(request.session_id, request.query, request.domain)
+
+@router.post("/stream", response_model=None, openapi_extra=CHAT_REQUEST_OPENAPI)
+async def chat_stream_endpoint(request: ChatRequest = Depends(parse_chat_request)):
+    """
+    Streaming chat endpoint (server-sent events).
+    Emits `delta` events as the reply is generated, then a final `done` event.
+    """
+    return StreamingResponse(
+        controller.handle_chat_stream(request.session_id, request.query, request.domain),
+        media_type="text/event-stream",
+    )
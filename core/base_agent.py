@@ -1,11 +1,43 @@
 # core/base_agent.py
+import inspect
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 from core.memory_interface import MemoryInterface
 from core.base_tool import BaseTool
 from core.logger import log_info, log_error
 from core.exceptions import AgentError, ToolError, MemoryError
 
+
+class _ToolList(list):
+    """Plain list of tools that notifies its owner whenever it is mutated in place."""
+
+    __slots__ = ("_on_change",)
+
+    def __init__(self, tools, on_change):
+        super().__init__(tools)
+        self._on_change = on_change
+
+
+def _notifying(name):
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._on_change()
+        return result
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in (
+    "append", "extend", "insert", "remove", "pop", "clear",
+    "__setitem__", "__delitem__", "__iadd__", "__imul__",
+):
+    setattr(_ToolList, _name, _notifying(_name))
+del _name
+
+
 class BaseAgent(ABC):
     """
     Base class for all AI Agents in the MCP framework.
@@ -15,6 +47,15 @@ class BaseAgent(ABC):
     name: str = "BaseAgent"
     description: str = "Generic agent interface"
 
+    # Whether a subclass overrides the pre/post hooks (resolved once per class)
+    _pre_overridden: bool = False
+    _post_overridden: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._pre_overridden = cls.pre_process is not BaseAgent.pre_process
+        cls._post_overridden = cls.post_process is not BaseAgent.post_process
+
     def __init__(
         self,
         memory: Optional[MemoryInterface] = None,
@@ -23,6 +64,26 @@ class BaseAgent(ABC):
         self.memory = memory
         self.tools = tools or []
 
+    @property
+    def tools(self) -> List[BaseTool]:
+        """Tools available to this agent; a live list, so in-place edits are kept."""
+        return self._tools
+
+    @tools.setter
+    def tools(self, tools: List[BaseTool]) -> None:
+        self._tools = _ToolList(tools, self._invalidate_tool_index)
+        self._tools_by_name: Optional[Dict[str, BaseTool]] = None
+
+    def _invalidate_tool_index(self) -> None:
+        self._tools_by_name = None
+
+    def _tool_index(self) -> Dict[str, BaseTool]:
+        """Name -> tool index, rebuilt lazily after the tool list changes (first match wins)."""
+        index = self._tools_by_name
+        if index is None:
+            index = self._tools_by_name = {tool.name: tool for tool in reversed(self._tools)}
+        return index
+
     # ---- core interface ----
     @abstractmethod
     def run(self, query: str, state: Dict[str, Any]) -> Dict[str, Any]:
@@ -32,6 +93,17 @@ class BaseAgent(ABC):
         """
         pass
 
+    async def stream_run(self, query: str, state: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of `run()`.
+        Yields zero or more `{"delta": str}` chunks followed by the final output dict.
+        Default implementation yields the `run()` result as the only item.
+        """
+        result = self.run(query, state)
+        if inspect.isawaitable(result):
+            result = await result
+        yield result
+
     # ---- optional hooks ----
     def pre_process(self, query: str, state: Dict[str, Any]) -> str:
         """Optional hook: normalize or enrich query before main execution."""
@@ -64,19 +136,27 @@ class BaseAgent(ABC):
             log_error(f"[{self.name}] memory write failed: {e}")
             raise MemoryError(str(e), context={"agent": self.name, "context_id": context_id})
 
-    def use_tool(self, tool_name: str, **kwargs) -> Any:
-        """Find and execute a registered tool by name."""
-        for tool in self.tools:
-            if tool.name == tool_name:
-                try:
-                    log_info(f"[{self.name}] using tool {tool_name}", params=kwargs)
-                    result = tool.safe_execute(**kwargs) if hasattr(tool, "safe_execute") else tool.execute(**kwargs)
-                    log_info(f"[{self.name}] tool {tool_name} completed successfully")
-                    return result
-                except Exception as e:
-                    log_error(f"[{self.name}] tool {tool_name} failed: {e}")
-                    raise ToolError(str(e), context={"agent": self.name, "tool": tool_name, "params": kwargs})
-        raise ToolError(f"Tool '{tool_name}' not found", context={"agent": self.name})
+    def use_tool(self, tool: Union[str, BaseTool], **kwargs) -> Any:
+        """
+        Execute a tool, either by registered name (dynamic dispatch)
+        or by passing the tool instance directly (skips the name lookup).
+        """
+        if isinstance(tool, str):
+            tool_name = tool
+            tool = self._tool_index().get(tool_name)
+            if tool is None:
+                raise ToolError(f"Tool '{tool_name}' not found", context={"agent": self.name})
+        else:
+            tool_name = tool.name
+
+        try:
+            log_info(f"[{self.name}] using tool {tool_name}", params=kwargs)
+            result = tool.safe_execute(**kwargs) if hasattr(tool, "safe_execute") else tool.execute(**kwargs)
+            log_info(f"[{self.name}] tool {tool_name} completed successfully")
+            return result
+        except Exception as e:
+            log_error(f"[{self.name}] tool {tool_name} failed: {e}")
+            raise ToolError(str(e), context={"agent": self.name, "tool": tool_name, "params": kwargs})
 
     # ---- advanced hooks ----
     def reflect(self, output: Dict[str, Any]) -> Dict[str, Any]:
@@ -94,11 +174,14 @@ class BaseAgent(ABC):
         """
         log_info(f"Agent {self.name} started execution", query=query)
         try:
-            processed_query = self.pre_process(query, state)
+            processed_query = self.pre_process(query, state) if self._pre_overridden else query
             result = self.run(processed_query, state)
-            result = self.post_process(result)
+            if self._post_overridden:
+                result = self.post_process(result)
             log_info(f"Agent {self.name} completed successfully")
             return result
         except Exception as e:
             log_error(f"Agent {self.name} failed: {e}")
-            raise AgentError(str(e), context={"agent": self.name, "query": query})
+            if isinstance(e, AgentError):
+                raise
+            raise AgentError(str(e), context={"agent": self.name, "query": query}) from e
@@ -14,6 +14,15 @@ class BaseNode(ABC):
     description: str = "Generic workflow node"
     node_type: str = "generic"  # e.g., "agent", "tool", "reflection", "control"
 
+    # Whether a subclass overrides the lifecycle hooks (resolved once per class)
+    _pre_overridden: bool = False
+    _post_overridden: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._pre_overridden = cls.pre_execute is not BaseNode.pre_execute
+        cls._post_overridden = cls.post_execute is not BaseNode.post_execute
+
     def __init__(self, agent=None, tools: Optional[list] = None):
         self.agent = agent              # Optional: Agent instance
         self.tools = tools or []        # Optional: Tool injection
@@ -47,25 +56,28 @@ class BaseNode(ABC):
         log_info(f"[{self.name}] node started execution", state_keys=list(state.keys()))
 
         try:
-            # --- pre hook ---
-            state = await self.pre_execute(state)
+            # --- pre hook (skipped when it is the default no-op) ---
+            if self._pre_overridden:
+                state = await self.pre_execute(state)
 
             # --- main logic ---
             result = await self.execute(state)
 
-            # --- post hook ---
-            result = await self.post_execute(state, result)
+            # --- post hook (skipped when it is the default no-op) ---
+            if self._post_overridden:
+                result = await self.post_execute(state, result)
 
             log_info(f"[{self.name}] node completed successfully")
             return result
 
-        except AgentError as e:
-            log_error(f"[{self.name}] agent failed: {e}")
-            return await self.on_error(e, state)
-
         except Exception as e:
+            # Single handler: expected agent failures fall back to on_error,
+            # anything else is wrapped once (keeping the original cause).
+            if isinstance(e, AgentError):
+                log_error(f"[{self.name}] agent failed: {e}")
+                return await self.on_error(e, state)
             log_error(f"[{self.name}] unexpected error: {e}")
-            raise NodeError(str(e), context={"node": self.name})
+            raise NodeError(str(e), context={"node": self.name}) from e
 
     # ---- helper methods ----
     def get_agent_name(self) -> Optional[str]:
@@ -13,7 +13,12 @@ class BaseTool(ABC):
     name: str = "BaseTool"
     description: str = "Generic tool interface"
     version: str = "1.0"
-    async_supported: bool = False  # Indicates whether async calls are supported
+    async_supported: bool = False  # Indicates whether async calls are supported (class or instance)
+    _aexecute_is_async: bool = True  # Whether `aexecute` is a coroutine function, resolved once per class
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._aexecute_is_async = inspect.iscoroutinefunction(cls.aexecute)
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
@@ -56,7 +61,7 @@ class BaseTool(ABC):
                 raise ToolError(f"Invalid input for tool {self.name}", context=kwargs)
 
             # --- Determine execution mode ---
-            if self.async_supported and inspect.iscoroutinefunction(self.aexecute):
+            if self.async_supported and self._aexecute_is_async:
                 result = await self.aexecute(**kwargs)
             else:
                 result = self.execute(**kwargs)
@@ -66,13 +71,12 @@ class BaseTool(ABC):
             log_info(f"[{self.name}] tool completed successfully")
             return result
 
-        except ToolError as e:
-            log_error(f"[{self.name}] tool error: {e}")
-            return self.on_error(e, **kwargs)
-
         except Exception as e:
+            if isinstance(e, ToolError):
+                log_error(f"[{self.name}] tool error: {e}")
+                return self.on_error(e, **kwargs)
             log_error(f"[{self.name}] unexpected exception: {e}")
-            raise ToolError(str(e), context={"tool": self.name})
+            raise ToolError(str(e), context={"tool": self.name}) from e
 
     # ---- callable alias (for syntactic sugar) ----
     async def __call__(self, **kwargs) -> Union[Any, Dict[str, Any]]:
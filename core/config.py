@@ -1,43 +1,117 @@
 import os
 from dotenv import load_dotenv
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Tuple
 
-load_dotenv()
+_dotenv_loaded = False
+_UNSET = object()
+
+
+def _ensure_dotenv() -> None:
+    """Load `.env` once, on first config access rather than at import."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
+
+def _as_bool(value: str) -> bool:
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+class EnvSetting:
+    """
+    Environment-backed setting, read and cast on first access, then cached.
+    Works on the class itself (`CurrentConfig.REDIS_PORT`); plain class attributes
+    in subclasses still override it. `BaseConfig.reload()` drops cached values.
+    """
+
+    def __init__(self, env: str, default: str, cast: Callable[[str], Any] = str):
+        self.env = env
+        self.default = default
+        self.cast = cast
+        self._value = _UNSET
+
+    def __get__(self, obj, owner=None) -> Any:
+        if self._value is _UNSET:
+            _ensure_dotenv()
+            self._value = self.cast(os.getenv(self.env, self.default))
+        return self._value
+
+    def reset(self) -> None:
+        self._value = _UNSET
 
 
 class BaseConfig:
     """Base configuration shared across environments."""
 
     # ---- General ----
-    ENV: str = os.getenv("APP_ENV", "dev")
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    ENV: str = EnvSetting("APP_ENV", "dev")
+    LOG_LEVEL: str = EnvSetting("LOG_LEVEL", "INFO")
 
     # ---- LLM / API ----
-    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
-    OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o")
-    RAG_API_URL: str = os.getenv("RAG_API_URL", "http://localhost:8002/api/v1/search")
+    OPENAI_API_KEY: str = EnvSetting("OPENAI_API_KEY", "")
+    OPENAI_MODEL: str = EnvSetting("OPENAI_MODEL", "gpt-4o")
+    RAG_API_URL: str = EnvSetting("RAG_API_URL", "http://localhost:8002/api/v1/search")
+    LLM_HTTP_TIMEOUT: float = EnvSetting("LLM_HTTP_TIMEOUT", "60", float)
+    LLM_HTTP_CONNECT_TIMEOUT: float = EnvSetting("LLM_HTTP_CONNECT_TIMEOUT", "5", float)
+    LLM_HTTP_RETRIES: int = EnvSetting("LLM_HTTP_RETRIES", "3", int)  # transport-level connect retries
+    LLM_HTTP_STATUS_RETRIES: int = EnvSetting("LLM_HTTP_STATUS_RETRIES", "3", int)  # 408/429/5xx retries
+    LLM_HTTP_MAX_CONNECTIONS: int = EnvSetting("LLM_HTTP_MAX_CONNECTIONS", "200", int)
+    LLM_HTTP_MAX_KEEPALIVE: int = EnvSetting("LLM_HTTP_MAX_KEEPALIVE", "100", int)
+    LLM_HTTP2: bool = EnvSetting("LLM_HTTP2", "true", _as_bool)
+    LLM_STREAM_FLUSH_MS: int = EnvSetting("LLM_STREAM_FLUSH_MS", "50", int)  # coalesce streamed deltas
+    LLM_CACHE_SIZE: int = EnvSetting("LLM_CACHE_SIZE", "10000", int)  # 0 disables the response cache
+    LLM_CACHE_TTL: int = EnvSetting("LLM_CACHE_TTL", "60", int)  # seconds
+    USE_UVLOOP: bool = EnvSetting("USE_UVLOOP", "true", _as_bool)  # libuv event loop (ignored on Windows)
 
     # ---- Memory ----
-    REDIS_HOST: str = os.getenv("REDIS_HOST", "localhost")
-    REDIS_PORT: int = int(os.getenv("REDIS_PORT", "6379"))
-    REDIS_DB: int = int(os.getenv("REDIS_DB", "0"))
-    REDIS_PREFIX: str = os.getenv("REDIS_PREFIX", "mcp")
-    MEMORY_TYPE: str = os.getenv("MEMORY_TYPE", "redis")  # redis | vector | hybrid
-    MEMORY_TTL: int = int(os.getenv("MEMORY_TTL", "86400"))  # optional expiration in seconds
+    REDIS_HOST: str = EnvSetting("REDIS_HOST", "localhost")
+    REDIS_PORT: int = EnvSetting("REDIS_PORT", "6379", int)
+    REDIS_DB: int = EnvSetting("REDIS_DB", "0", int)
+    REDIS_PREFIX: str = EnvSetting("REDIS_PREFIX", "mcp")
+    REDIS_POOL_SIZE: int = EnvSetting("REDIS_POOL_SIZE", "32", int)  # max pooled connections
+    REDIS_COMPRESS_THRESHOLD: int = EnvSetting("REDIS_COMPRESS_THRESHOLD", "4096", int)  # bytes; 0 = off
+    MEMORY_TYPE: str = EnvSetting("MEMORY_TYPE", "redis")  # redis | vector | hybrid
+    MEMORY_TTL: int = EnvSetting("MEMORY_TTL", "86400", int)  # optional expiration in seconds
+    STATE_WRITE_BEHIND: bool = EnvSetting("STATE_WRITE_BEHIND", "false", _as_bool)  # queue state/message writes
+    STATE_FLUSH_MAX_BATCH: int = EnvSetting("STATE_FLUSH_MAX_BATCH", "64", int)  # max writes per flush
+    STATE_FLUSH_MS: int = EnvSetting("STATE_FLUSH_MS", "50", int)  # write-behind coalescing window
+    MEMORY_EMBED_BATCH: int = EnvSetting("MEMORY_EMBED_BATCH", "16", int)  # texts per background embed call
+    VECTOR_DIM: int = EnvSetting("VECTOR_DIM", "768", int)  # embedding dimension
+    VECTOR_INDEX: str = EnvSetting("VECTOR_INDEX", "ivfpq")  # ivfpq | hnsw | flat (FAISS)
+    VECTOR_INDEX_PATH: str = EnvSetting("VECTOR_INDEX_PATH", "")  # persist the index here (empty = in-memory)
+    VECTOR_NLIST: int = EnvSetting("VECTOR_NLIST", "100", int)  # IVF cells
+    VECTOR_PQ_M: int = EnvSetting("VECTOR_PQ_M", "16", int)  # PQ sub-quantizers (must divide VECTOR_DIM)
 
     # ---- LangGraph ----
-    GRAPH_EXEC_MODE: str = os.getenv("GRAPH_EXEC_MODE", "local")  # local / async / distributed
-    GRAPH_MAX_DEPTH: int = int(os.getenv("GRAPH_MAX_DEPTH", "5"))
+    GRAPH_EXEC_MODE: str = EnvSetting("GRAPH_EXEC_MODE", "local")  # local / async / distributed
+    GRAPH_MAX_DEPTH: int = EnvSetting("GRAPH_MAX_DEPTH", "5", int)
+    REFLECTION_LOCAL_REVIEW: bool = EnvSetting("REFLECTION_LOCAL_REVIEW", "true", _as_bool)  # heuristic pre-check
 
     # ---- Paths ----
     PROJECT_ROOT: Path = Path(__file__).resolve().parent.parent
     DATA_DIR: Path = PROJECT_ROOT / "data"
 
+    # Upper-case setting names (own + inherited), resolved once per class
+    _CONFIG_KEYS: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._CONFIG_KEYS = _collect_config_keys(cls)
+
     @classmethod
     def as_dict(cls) -> Dict[str, Any]:
         """Return all config as dictionary (for debugging or introspection)."""
-        return {k: getattr(cls, k) for k in dir(cls) if k.isupper()}
+        return {k: getattr(cls, k) for k in cls._CONFIG_KEYS}
+
+    @classmethod
+    def reload(cls) -> None:
+        """Re-read environment-backed settings on next access (e.g. after changing os.environ)."""
+        for klass in cls.__mro__:
+            for value in vars(klass).values():
+                if isinstance(value, EnvSetting):
+                    value.reset()
 
     @classmethod
     def summary(cls) -> str:
@@ -47,6 +121,16 @@ class BaseConfig:
         return "\n".join(lines)
 
 
+def _collect_config_keys(cls: type) -> Tuple[str, ...]:
+    """Sorted public upper-case attribute names across the class hierarchy (same order as `dir()`)."""
+    return tuple(sorted({
+        k for klass in cls.__mro__ for k in vars(klass) if k.isupper() and not k.startswith("_")
+    }))
+
+
+BaseConfig._CONFIG_KEYS = _collect_config_keys(BaseConfig)
+
+
 # ---- Environment-specific Config ----
 
 class DevConfig(BaseConfig):
@@ -64,9 +148,15 @@ class ProdConfig(BaseConfig):
 # ---- Active Config Selector ----
 
 def get_config() -> BaseConfig:
+    _ensure_dotenv()
     env = os.getenv("APP_ENV", "dev").lower()
     return ProdConfig if env == "prod" else DevConfig
 
 
-# Alias for global use
-CurrentConfig = get_config()
+# Alias for global use, resolved on first access (`from core.config import CurrentConfig`
+# or `core.config.CurrentConfig`) so importing this module does not load `.env`.
+def __getattr__(name: str) -> Any:
+    if name == "CurrentConfig":
+        config = globals()["CurrentConfig"] = get_config()
+        return config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
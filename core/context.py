@@ -0,0 +1,35 @@
+# core/context.py
+import asyncio
+from contextlib import contextmanager
+from contextvars import Context, ContextVar
+from typing import Any, Coroutine, Dict, Iterator, Optional
+
+# Request-scoped values (session_id, domain, trace_id, ...) visible to every
+# coroutine running on behalf of the current request. Treat the dict as read-only;
+# use `request_context()` to bind new values.
+request_ctx: ContextVar[Optional[Dict[str, Any]]] = ContextVar("request_ctx", default=None)
+
+
+def get_request_context() -> Dict[str, Any]:
+    """Return the values bound for the current request (empty outside a request)."""
+    return request_ctx.get() or {}
+
+
+@contextmanager
+def request_context(**values: Any) -> Iterator[Dict[str, Any]]:
+    """Bind request-scoped values, merged over any outer context, for the duration of the block."""
+    ctx = {**get_request_context(), **values}
+    token = request_ctx.set(ctx)
+    try:
+        yield ctx
+    finally:
+        request_ctx.reset(token)
+
+
+def spawn_background(coro: Coroutine) -> asyncio.Task:
+    """
+    Start a long-lived background task in a fresh, empty context.
+    `asyncio.create_task` copies the caller's context, so a worker started lazily from a
+    request would otherwise keep (and log) that request's values for its whole lifetime.
+    """
+    return Context().run(asyncio.create_task, coro)
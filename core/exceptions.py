@@ -1,9 +1,15 @@
 # core/exceptions.py
 class MCPError(Exception):
     """Base exception for all MCP-related errors."""
+    _prefix: str = "MCPError: "  # "<ClassName>: ", resolved once per subclass
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._prefix = cls.__name__ + ": "
+
     def __init__(self, message: str, *, context: dict | None = None):
         self.context = context or {}
-        super().__init__(f"{self.__class__.__name__}: {message}")
+        super().__init__(self._prefix + str(message))
 
 
 class AgentError(MCPError):
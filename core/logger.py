@@ -3,6 +3,7 @@ import logging
 import sys
 from datetime import datetime
 from core.config import CurrentConfig
+from core.context import request_ctx
 
 def setup_logger(name: str = "mcp", level: str | None = None) -> logging.Logger:
     """Setup a consistent logger for the MCP framework."""
@@ -27,23 +28,54 @@ def get_logger(name: str = "mcp") -> logging.Logger:
 # ---- Helper functions ----
 logger = setup_logger()
 
-def log_debug(message: str, **context):
-    logger.debug(_format(message, context))
+# `message` may carry %-placeholders filled from `*args`; like the `[k=v]` context,
+# they are only rendered when a handler formats the record.
+def log_debug(message: str, *args, **context):
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s", _LazyMessage(message, args, context))
 
-def log_info(message: str, **context):
-    logger.info(_format(message, context))
+def log_info(message: str, *args, **context):
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("%s", _LazyMessage(message, args, context))
 
-def log_warning(message: str, **context):
-    logger.warning(_format(message, context))
+def log_warning(message: str, *args, **context):
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning("%s", _LazyMessage(message, args, context))
 
-def log_error(message: str, **context):
-    logger.error(_format(message, context))
+def log_error(message: str, *args, **context):
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error("%s", _LazyMessage(message, args, context))
 
-def log_exception(message: str, **context):
-    logger.exception(_format(message, context))
+def log_exception(message: str, *args, **context):
+    if logger.isEnabledFor(logging.ERROR):
+        logger.exception("%s", _LazyMessage(message, args, context))
+
+def debug_enabled() -> bool:
+    """Guard for debug-only context that is itself costly to build (lists, dumps, ...)."""
+    return logger.isEnabledFor(logging.DEBUG)
 
 
 # ---- Internal utility ----
+class _LazyMessage:
+    """
+    Defers building the `[k=v | ...]` suffix until a handler actually formats the record.
+    Request-scoped values from `core.context` are merged in; explicit kwargs win.
+    """
+
+    __slots__ = ("message", "args", "context", "request")
+
+    def __init__(self, message: str, args: tuple, context: dict):
+        self.message = message
+        self.args = args
+        self.context = context
+        self.request = request_ctx.get()  # captured now: formatting may happen elsewhere
+
+    def __str__(self) -> str:
+        context = {**self.request, **self.context} if self.request else self.context
+        message = self.message % self.args if self.args else self.message
+        return _format(message, context)
+
+
 def _format(message: str, context: dict) -> str:
     if not context:
         return message
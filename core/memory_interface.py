@@ -1,6 +1,6 @@
 # core/memory_interface.py
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 import datetime
 
 class MemoryInterface(ABC):
@@ -37,6 +37,14 @@ class MemoryInterface(ABC):
         """Append a single message to memory (short-term conversation)."""
         pass
 
+    async def append_messages_bulk(self, session_id: str, messages: List[Dict[str, Any]]):
+        """
+        Append several messages ({role, content, metadata}) at once.
+        Default appends one by one; backends should override with a batched write.
+        """
+        for m in messages:
+            await self.append_message(session_id, m["role"], m["content"], m.get("metadata"))
+
     @abstractmethod
     async def get_messages(
         self,
@@ -56,6 +64,14 @@ class MemoryInterface(ABC):
         """Optional: Store an embedding into long-term memory."""
         pass
 
+    async def store_vectors_bulk(self, entries: List[Tuple[str, List[float], Dict[str, Any]]]):
+        """
+        Store several (session_id, embedding, metadata) entries at once.
+        Default stores one by one; backends should override with a batched write.
+        """
+        for session_id, embedding, metadata in entries:
+            await self.store_vector(session_id, embedding, metadata)
+
     async def search_vector(
         self,
         session_id: str,
@@ -74,6 +90,10 @@ class MemoryInterface(ABC):
         joined = " ".join([m["content"] for m in messages[-10:]])
         return f"Session summary: {joined[:300]}..."
 
+    async def aclose(self):
+        """Optional: release connections/resources on shutdown."""
+        pass
+
     async def metadata(self, session_id: str) -> Dict[str, Any]:
         """Optional: return memory statistics or metadata (size, last update)."""
         return {"session_id": session_id, "timestamp": datetime.datetime.utcnow().isoformat()}
@@ -1,4 +1,6 @@
-from typing import Type, Dict, Any, Optional, Union
+import asyncio
+import weakref
+from typing import Type, Dict, Any, Optional, Set, Union
 from core.logger import log_info, log_error
 from core.exceptions import RegistryError, ConfigError
 from core.base_agent import BaseAgent
@@ -12,17 +14,32 @@ class BaseRegistry:
     """Generic registry base class for all MCP components."""
 
     _registry: Dict[str, Any] = {}
+    _singletons: Set[str] = set()        # names whose instance is built once and reused
+    _instances: Dict[str, Any] = {}      # memoized singleton instances
     component_type: str = "component"
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Give every registry its own storage instead of sharing the base-class dicts
+        if "_registry" not in cls.__dict__:
+            cls._registry = {}
+        cls._singletons = set()
+        cls._instances = {}
+
     @classmethod
-    def register(cls, name: str, component: Union[Type, Any], override: bool = False):
+    def register(cls, name: str, component: Union[Type, Any], override: bool = False, singleton: bool = False):
         if name in cls._registry and not override:
             raise RegistryError(
                 f"[{cls.component_type}] '{name}' already registered.",
                 context={"name": name, "type": cls.component_type},
             )
         cls._registry[name] = component
-        log_info(f"[{cls.component_type}] registered", name=name)
+        cls._instances.pop(name, None)
+        if singleton:
+            cls._singletons.add(name)
+        else:
+            cls._singletons.discard(name)
+        log_info(f"[{cls.component_type}] registered", name=name, singleton=singleton)
 
     @classmethod
     def get(cls, name: str) -> Optional[Any]:
@@ -34,6 +51,15 @@ class BaseRegistry:
 
     @classmethod
     def create_instance(cls, name: str, **kwargs) -> Any:
+        """
+        Instantiate a registered component.
+        Components registered with `singleton=True` are built once (on the first
+        call without kwargs) and the same instance is returned afterwards.
+        """
+        cached = cls._instances.get(name)
+        if cached is not None and not kwargs:
+            return cached
+
         try:
             component = cls.get(name)
             if component is None:
@@ -44,6 +70,8 @@ class BaseRegistry:
 
             if isinstance(component, type):
                 instance = component(**kwargs)
+                if name in cls._singletons and not kwargs:
+                    cls._instances[name] = instance
                 log_info(f"[{cls.component_type}] instance created", name=name)
                 return instance
 
@@ -57,6 +85,8 @@ class BaseRegistry:
     @classmethod
     def clear(cls):
         cls._registry.clear()
+        cls._singletons.clear()
+        cls._instances.clear()
         log_info(f"[{cls.component_type}] registry cleared")
 
 
@@ -80,6 +110,11 @@ class NodeRegistry(BaseRegistry):
 class MemoryRegistry(BaseRegistry):
     component_type = "memory"
     _registry: Dict[str, Type[MemoryInterface]] = {}
+    # Active backend per event loop: pooled connections (e.g. redis.asyncio) belong to the loop
+    # that opened them. Weak keys drop an entry with its loop; `_active_no_loop` serves callers
+    # outside any running loop.
+    _active: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, MemoryInterface]" = weakref.WeakKeyDictionary()
+    _active_no_loop: Optional[MemoryInterface] = None
 
     @classmethod
     def autoload(cls):
@@ -97,7 +132,16 @@ class MemoryRegistry(BaseRegistry):
 
     @classmethod
     def get_active_memory(cls) -> MemoryInterface:
-        """Get active memory backend instance based on config."""
+        """
+        Get the active memory backend instance based on config.
+        Built once per event loop and shared by every caller on that loop, so each loop
+        reuses one client/connection pool (under uvicorn: one backend for the process).
+        """
+        loop = _running_loop()
+        active = cls._active.get(loop) if loop is not None else cls._active_no_loop
+        if active is not None:
+            return active
+
         if not cls._registry:
             cls.autoload()
 
@@ -109,6 +153,33 @@ class MemoryRegistry(BaseRegistry):
                 context={"available": cls.list()},
             )
 
-        instance = cls.create_instance(memory_type)
+        active = cls.create_instance(memory_type)
+        if loop is not None:
+            cls._active[loop] = active
+        else:
+            cls._active_no_loop = active
         log_info("Active memory backend initialized", backend=memory_type)
-        return instance
+        return active
+
+    @classmethod
+    async def aclose_active(cls):
+        """Close the current loop's backend (and a loop-less one, if built) so connections are released."""
+        loop = _running_loop()
+        for active in (cls._active.pop(loop, None) if loop is not None else None, cls._active_no_loop):
+            if active is not None:
+                await active.aclose()
+                log_info("Active memory backend closed")
+        cls._active_no_loop = None
+
+    @classmethod
+    def clear(cls):
+        super().clear()
+        cls._active = weakref.WeakKeyDictionary()
+        cls._active_no_loop = None
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
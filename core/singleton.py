@@ -0,0 +1,36 @@
+# core/singleton.py
+import functools
+import threading
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+_UNSET = object()
+
+
+def singleton(builder: Callable[[], T]) -> Callable[[], T]:
+    """
+    Build-once provider decorator (replacement for `@lru_cache(maxsize=1)`).
+    The first call constructs the instance under a lock, so a concurrent cold-start
+    burst cannot build duplicates; later calls just return the bound instance.
+    A builder that raises is retried on the next call. `.cache_clear()` resets it.
+    """
+    instance = _UNSET
+    lock = threading.Lock()
+
+    @functools.wraps(builder)
+    def get() -> T:
+        nonlocal instance
+        if instance is _UNSET:
+            with lock:
+                if instance is _UNSET:
+                    instance = builder()
+        return instance
+
+    def cache_clear() -> None:
+        nonlocal instance
+        with lock:
+            instance = _UNSET
+
+    get.cache_clear = cache_clear
+    return get
@@ -0,0 +1,34 @@
+# core/yaml_cache.py
+import os
+from typing import Any, Dict, Optional, Tuple
+import yaml
+
+# LibYAML's C loader when PyYAML was built against it (pure-Python SafeLoader otherwise)
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# path -> (st_mtime_ns, parsed document)
+_YAML_CACHE: Dict[str, Tuple[int, Any]] = {}
+
+
+def load_yaml_cached(path: str, mtime_ns: Optional[int] = None) -> Any:
+    """
+    Parse a YAML file, memoized on (path, mtime).
+    The file is only re-parsed after it changes on disk. The returned object is
+    shared between callers, so treat it as read-only.
+    Pass `mtime_ns` when the caller already has a stat result to skip another stat().
+    """
+    if mtime_ns is None:
+        mtime_ns = os.stat(path).st_mtime_ns
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    # Binary mode: bytes go straight to the loader (no Python-level decode pass)
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=_Loader)
+    _YAML_CACHE[path] = (mtime_ns, data)
+    return data
+
+
+def clear_yaml_cache() -> None:
+    _YAML_CACHE.clear()
@@ -1,26 +1,55 @@
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
+from api.responses import OrjsonResponse
 from core.config import CurrentConfig
 from api.routes.chat_route import router as chat_router
-from core.registry import AgentRegistry, NodeRegistry
+from core.registry import AgentRegistry, NodeRegistry, MemoryRegistry
 from agents.hello_agent import HelloAgent
 from nodes.greeting_node import GreetingNode
+from providers.llm_service_provider import get_llm_coalescer
+from providers.utils.openai_client import close_http_client
+from orchestrator.state_manager import StateManager
 
-app = FastAPI(title="MCP Orchestrator API", version="1.0.0", docs_url="/docs", redoc_url="/redoc")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Set up shared resources on the server's event loop, release them on shutdown
+    MemoryRegistry.get_active_memory()  # build the backend (and its pool) on the serving loop
+    yield
+    await get_llm_coalescer().drain()  # let in-flight LLM calls finish
+    await StateManager.drain_all()  # flush queued state/messages/vectors, stop workers, before closing Redis
+    await close_http_client()
+    await MemoryRegistry.aclose_active()
+
+
+app = FastAPI(
+    title="MCP Orchestrator API",
+    version="1.0.0",
+    docs_url="/docs",
+    redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=OrjsonResponse,  # orjson encodes responses much faster than stdlib json
+)
 
 # CORS Configuration - use environment variable for production
-cors_origins = os.getenv("CORS_ALLOWED_ORIGINS", "*")
+cors_origins = os.getenv("CORS_ALLOWED_ORIGINS", "").strip() or "*"
 if cors_origins == "*":
     # Development: allow all origins
     allow_origins = ["*"]
 else:
-    # Production: use specific origins
-    allow_origins = [origin.strip() for origin in cors_origins.split(",")]
+    # Production: use specific origins (normalized once; stray commas/blanks dropped)
+    allow_origins = [o for o in (o.strip() for o in cors_origins.split(",")) if o]
+
+# Optional: one compiled regex instead of per-request list membership (e.g. https://.*\.example\.com)
+allow_origin_regex = os.getenv("CORS_ALLOWED_ORIGIN_REGEX") or None
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allow_origins,
+    allow_origin_regex=allow_origin_regex,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -30,9 +59,35 @@ app.add_middleware(
 app.include_router(chat_router)
 
 # Register your Agents and Nodes here
-AgentRegistry.register("HelloAgent", HelloAgent)
-NodeRegistry.register("GreetingNode", GreetingNode)
+# (singleton=True reuses one instance across requests for stateless components)
+AgentRegistry.register("HelloAgent", HelloAgent, singleton=True)
+NodeRegistry.register("GreetingNode", GreetingNode, singleton=True)
+
+_HEALTH_BODY = b'{"status":"ok"}'
+
 
 @app.get("/health")
-def health():
-    return {"status": "ok"}
\ No newline at end of file
+async def health():
+    # async + prebuilt bytes: served on the event loop, no threadpool hop or encoder pass
+    return Response(_HEALTH_BODY, media_type="application/json")
+
+
+def _uvicorn_impl(module: str, enabled: bool = True) -> str:
+    """uvicorn `loop` / `http` option: the named implementation when importable, else "auto"."""
+    import importlib.util
+    return module if enabled and importlib.util.find_spec(module) is not None else "auto"
+
+
+if __name__ == "__main__":
+    import sys
+    import uvicorn
+
+    # uvloop / httptools when installed (uvloop never on Windows or with USE_UVLOOP=false)
+    uvicorn.run(
+        "main:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8001")),
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        loop=_uvicorn_impl("uvloop", sys.platform != "win32" and CurrentConfig.USE_UVLOOP),
+        http=_uvicorn_impl("httptools"),
+    )
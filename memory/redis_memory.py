@@ -1,6 +1,9 @@
-import json
+import orjson
+from array import array
+import msgpack
+import zstandard
 import redis.asyncio as aioredis
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from core.logger import get_logger
 from core.exceptions import MemoryError
 from core.config import CurrentConfig
@@ -8,6 +11,10 @@ from core.memory_interface import MemoryInterface
 
 logger = get_logger("RedisMemory")
 
+# Payload format markers (first byte). Entries written before these start with "{" (plain JSON).
+_MSGPACK = b"\x01"       # msgpack
+_MSGPACK_ZSTD = b"\x02"  # zstd-compressed msgpack
+
 
 class RedisMemory(MemoryInterface):
     """
@@ -21,19 +28,63 @@ class RedisMemory(MemoryInterface):
         redis_db = getattr(CurrentConfig, "REDIS_DB", 0)
         self.prefix = getattr(CurrentConfig, "REDIS_PREFIX", "mcp")
 
+        pool_size = getattr(CurrentConfig, "REDIS_POOL_SIZE", 32)
+
+        # Payloads larger than this (bytes) are zstd-compressed; 0 disables compression
+        self.compress_threshold = getattr(CurrentConfig, "REDIS_COMPRESS_THRESHOLD", 4096)
+        self._zstd = zstandard.ZstdCompressor(level=3)
+        self._zstdd = zstandard.ZstdDecompressor()
+
         try:
-            self.redis = aioredis.Redis(host=redis_host, port=redis_port, db=redis_db, decode_responses=True)
+            # One explicit pool per backend instance; MemoryRegistry shares the instance process-wide
+            self.pool = aioredis.ConnectionPool(
+                host=redis_host,
+                port=redis_port,
+                db=redis_db,
+                decode_responses=False,  # payloads are binary (msgpack)
+                max_connections=pool_size,
+            )
+            self.redis = aioredis.Redis(connection_pool=self.pool)
             logger.info(f"[RedisMemory] Connected to Redis ({redis_host}:{redis_port}, db={redis_db})")
         except Exception as e:
             logger.error(f"[RedisMemory] Failed to connect: {e}")
             raise MemoryError("Unable to connect to Redis") from e
 
+    async def aclose(self):
+        """Close the client and drop every pooled connection (called on shutdown)."""
+        await self.redis.aclose()
+        await self.pool.disconnect()
+        logger.info("[RedisMemory] Connection pool closed")
+
+    def pipeline(self):
+        """
+        Non-transactional pipeline for batching commands into one round-trip:
+        `async with memory.pipeline() as p: p.get(...); p.rpush(...); await p.execute()`
+        """
+        return self.redis.pipeline(transaction=False)
+
+    # ---- Serialization ----
+    def _encode(self, obj: Any) -> bytes:
+        data = msgpack.packb(obj, use_bin_type=True)
+        if self.compress_threshold and len(data) > self.compress_threshold:
+            return _MSGPACK_ZSTD + self._zstd.compress(data)
+        return _MSGPACK + data
+
+    def _decode(self, raw: bytes) -> Any:
+        marker = raw[:1]
+        if marker == _MSGPACK:
+            return msgpack.unpackb(raw[1:], raw=False)
+        if marker == _MSGPACK_ZSTD:
+            return msgpack.unpackb(self._zstdd.decompress(raw[1:]), raw=False)
+        # Legacy JSON entry; rewritten as msgpack the next time it is saved
+        return orjson.loads(raw)
+
     # ---- State Operations ----
     async def load_state(self, session_id: str) -> Dict[str, Any]:
         """Load full state dict from Redis."""
         try:
             raw = await self.redis.get(f"{self.prefix}:state:{session_id}")
-            return json.loads(raw) if raw else {}
+            return self._decode(raw) if raw else {}
         except Exception as e:
             logger.error(f"[RedisMemory] load_state failed: {e}")
             raise MemoryError("Failed to load state") from e
@@ -41,8 +92,8 @@ class RedisMemory(MemoryInterface):
     async def save_state(self, session_id: str, state: Dict[str, Any]):
         """Save workflow state dict."""
         try:
-            await self.redis.set(f"{self.prefix}:state:{session_id}", json.dumps(state))
-            logger.debug(f"[RedisMemory] Saved state for session={session_id}")
+            await self.redis.set(f"{self.prefix}:state:{session_id}", self._encode(state))
+            logger.debug("[RedisMemory] Saved state for session=%s", session_id)
         except Exception as e:
             logger.error(f"[RedisMemory] save_state failed: {e}")
             raise MemoryError("Failed to save state") from e
@@ -64,18 +115,36 @@ class RedisMemory(MemoryInterface):
         """Append a message to Redis list."""
         try:
             message = {"role": role, "content": content, "metadata": metadata or {}}
-            await self.redis.rpush(f"{self.prefix}:messages:{session_id}", json.dumps(message))
+            await self.redis.rpush(f"{self.prefix}:messages:{session_id}", self._encode(message))
         except Exception as e:
             logger.error(f"[RedisMemory] append_message failed: {e}")
             raise MemoryError("Failed to append message") from e
 
+    async def append_messages_bulk(self, session_id: str, messages: List[Dict[str, Any]]):
+        """Append several messages ({role, content, metadata}) with a single RPUSH."""
+        if not messages:
+            return
+        try:
+            entries = [
+                self._encode({"role": m["role"], "content": m["content"], "metadata": m.get("metadata") or {}})
+                for m in messages
+            ]
+            await self.redis.rpush(f"{self.prefix}:messages:{session_id}", *entries)
+        except Exception as e:
+            logger.error(f"[RedisMemory] append_messages_bulk failed: {e}")
+            raise MemoryError("Failed to append messages") from e
+
     async def get_messages(self, session_id: str, limit: Optional[int] = 10) -> List[Dict[str, Any]]:
         """Retrieve recent messages."""
+        if limit is not None and limit <= 0:
+            return []  # nothing requested: skip the round-trip
+
         try:
-            total = await self.redis.llen(f"{self.prefix}:messages:{session_id}")
-            start = max(total - limit, 0)
-            items = await self.redis.lrange(f"{self.prefix}:messages:{session_id}", start, total)
-            return [json.loads(i) for i in items]
+            # Negative indices select the last `limit` items in a single command (no LLEN needed);
+            # limit=None returns the whole history
+            start = -limit if limit is not None else 0
+            items = await self.redis.lrange(f"{self.prefix}:messages:{session_id}", start, -1)
+            return [self._decode(i) for i in items]
         except Exception as e:
             logger.error(f"[RedisMemory] get_messages failed: {e}")
             raise MemoryError("Failed to get messages") from e
@@ -84,11 +153,35 @@ class RedisMemory(MemoryInterface):
     async def store_vector(self, session_id: str, embedding: List[float], metadata: Optional[Dict[str, Any]] = None):
         """Store embedding and metadata."""
         try:
-            entry = json.dumps({"embedding": embedding, "metadata": metadata or {}})
+            # Packed float32 bytes ("e", dimension "d") instead of a list of per-float objects
+            entry = self._encode({
+                "m": metadata or {},
+                "e": array("f", embedding).tobytes(),
+                "d": len(embedding),
+            })
             await self.redis.rpush(f"{self.prefix}:vectors:{session_id}", entry)
         except Exception as e:
             logger.warning(f"[RedisMemory] store_vector skipped: {e}")
 
+    async def store_vectors_bulk(self, entries: List[Tuple[str, List[float], Dict[str, Any]]]):
+        """Store several (session_id, embedding, metadata) entries: one RPUSH per session, one round-trip."""
+        if not entries:
+            return
+        try:
+            grouped: Dict[str, List[bytes]] = {}
+            for session_id, embedding, metadata in entries:
+                grouped.setdefault(session_id, []).append(self._encode({
+                    "m": metadata or {},
+                    "e": array("f", embedding).tobytes(),
+                    "d": len(embedding),
+                }))
+            async with self.pipeline() as pipe:
+                for session_id, packed in grouped.items():
+                    pipe.rpush(f"{self.prefix}:vectors:{session_id}", *packed)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"[RedisMemory] store_vectors_bulk skipped: {e}")
+
     async def search_vector(self, session_id: str, query_vector: List[float], top_k: int = 5) -> List[Dict[str, Any]]:
         """Placeholder for similarity search (requires vector DB)."""
         logger.debug(f"[RedisMemory] Vector search not implemented yet.")
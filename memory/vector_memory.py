@@ -1,21 +1,193 @@
-from typing import Any, Dict, List
+import asyncio
+import os
+from typing import Any, Dict, List, Tuple
+import msgpack
+from core.config import CurrentConfig
 from core.logger import get_logger
 
+try:
+    import faiss  # optional: faiss-cpu / faiss-gpu
+    import numpy as np
+except ImportError:  # pragma: no cover - backend stays a no-op placeholder
+    faiss = None
+    np = None
+
 logger = get_logger("VectorMemory")
 
 
 class VectorMemory:
     """
-    Placeholder for long-term semantic memory.
-    Intended for Milvus / FAISS / Chroma integration.
+    Long-term semantic memory backed by a FAISS index.
+    - VECTOR_INDEX=ivfpq: IndexIVFPQ (compressed, for large stores). Vectors are buffered
+      and searched exactly until enough samples exist to train the quantizer.
+    - VECTOR_INDEX=hnsw: IndexHNSWFlat (no training, medium scale).
+    - VECTOR_INDEX=flat: exact IndexFlatL2.
+    Metadata lives in a parallel id -> (session_id, metadata) map; both are persisted
+    to VECTOR_INDEX_PATH (index + ".meta") when set. Without faiss this stays a no-op.
     """
 
     def __init__(self):
-        logger.info("[VectorMemory] Initialized placeholder backend.")
+        self.dim = getattr(CurrentConfig, "VECTOR_DIM", 768)
+        self.kind = getattr(CurrentConfig, "VECTOR_INDEX", "ivfpq").lower()
+        self.index_path = getattr(CurrentConfig, "VECTOR_INDEX_PATH", "") or None
+        self.nlist = getattr(CurrentConfig, "VECTOR_NLIST", 100)
+        self.pq_m = getattr(CurrentConfig, "VECTOR_PQ_M", 16)
+
+        self.index = None
+        self._meta: Dict[int, Tuple[str, Dict[str, Any]]] = {}
+        self._next_id = 0
+        # IVF-PQ training buffer (ids, vectors) until the quantizer can be trained
+        self._pending_ids: List[int] = []
+        self._pending: List[List[float]] = []
+        self._lock = asyncio.Lock()  # serializes index add / train / search
+
+        if faiss is None:
+            logger.info("[VectorMemory] faiss not installed; using no-op placeholder backend.")
+            return
+
+        self.index = self._load_index() or self._build_index()
+        logger.info(f"[VectorMemory] Initialized [index={self.kind} | dim={self.dim} | size={self.index.ntotal}]")
+
+    # ---- Index construction / persistence ----
+    def _build_index(self):
+        if self.kind == "flat":
+            index = faiss.IndexIDMap(faiss.IndexFlatL2(self.dim))
+        elif self.kind == "hnsw":
+            index = faiss.IndexIDMap(faiss.IndexHNSWFlat(self.dim, 32))
+        else:
+            self.kind = "ivfpq"
+            index = faiss.IndexIVFPQ(faiss.IndexFlatL2(self.dim), self.dim, self.nlist, self.pq_m, 8)
+            index.nprobe = min(8, self.nlist)  # cells visited per query (recall vs. speed)
 
+        # Offload to GPU when one is available (faiss-gpu builds only)
+        if getattr(faiss, "get_num_gpus", lambda: 0)() > 0:
+            index = faiss.index_cpu_to_gpu(faiss.StandardGpuResources(), 0, index)
+        return index
+
+    def _load_index(self):
+        if not self.index_path or not os.path.exists(self.index_path):
+            return None
+        try:
+            index = faiss.read_index(self.index_path)
+            with open(self.index_path + ".meta", "rb") as f:
+                saved = msgpack.unpackb(f.read(), raw=False, strict_map_key=False)
+            self._meta = {int(k): (v[0], v[1]) for k, v in saved["meta"].items()}
+            self._next_id = saved["next_id"]
+            self._pending_ids, self._pending = saved.get("pending_ids", []), saved.get("pending", [])
+            logger.info(f"[VectorMemory] Loaded index from {self.index_path}")
+            return index
+        except Exception as e:
+            logger.warning(f"[VectorMemory] Failed to load index, starting empty: {e}")
+            self._meta, self._next_id = {}, 0
+            return None
+
+    def save(self):
+        """Persist the index and its metadata to VECTOR_INDEX_PATH (no-op when unset)."""
+        if self.index is None or not self.index_path:
+            return
+        index = self.index
+        if hasattr(faiss, "index_gpu_to_cpu") and "Gpu" in type(index).__name__:
+            index = faiss.index_gpu_to_cpu(index)
+        faiss.write_index(index, self.index_path)
+        with open(self.index_path + ".meta", "wb") as f:
+            f.write(msgpack.packb({
+                "meta": self._meta,
+                "next_id": self._next_id,
+                "pending_ids": self._pending_ids,
+                "pending": self._pending,
+            }, use_bin_type=True))
+
+    @property
+    def _train_size(self) -> int:
+        # FAISS wants ~39 training samples per centroid (nlist IVF cells, 2**8 PQ codes)
+        return max(self.nlist, 256) * 39
+
+    # ---- Public API ----
     async def store_vector(self, session_id: str, embedding: List[float], metadata: Dict[str, Any]):
-        logger.debug(f"[VectorMemory] store_vector called for {session_id}")
+        if self.index is None:
+            logger.debug(f"[VectorMemory] store_vector called for {session_id}")
+            return
+        if len(embedding) != self.dim:
+            logger.warning(f"[VectorMemory] store_vector skipped: expected dim={self.dim}, got {len(embedding)}")
+            return
+
+        await self._add([(session_id, embedding, metadata)])
+
+    async def store_vectors_bulk(self, entries: List[Tuple[str, List[float], Dict[str, Any]]]):
+        """Store several (session_id, embedding, metadata) entries with a single index add."""
+        if self.index is None:
+            return
+        valid = [entry for entry in entries if len(entry[1]) == self.dim]
+        if len(valid) < len(entries):
+            logger.warning(f"[VectorMemory] store_vectors_bulk skipped {len(entries) - len(valid)} entries (dim != {self.dim})")
+        if valid:
+            await self._add(valid)
+
+    async def _add(self, entries: List[Tuple[str, List[float], Dict[str, Any]]]):
+        # Every index mutation and search runs under self._lock, so FAISS never sees
+        # concurrent add/train/search calls from the loop and worker threads
+        async with self._lock:
+            ids: List[int] = []
+            vectors: List[List[float]] = []
+            for session_id, embedding, metadata in entries:
+                vid = self._next_id
+                self._next_id += 1
+                self._meta[vid] = (session_id, metadata or {})
+                ids.append(vid)
+                vectors.append(embedding)
+
+            if self.index.is_trained:
+                self.index.add_with_ids(np.asarray(vectors, dtype=np.float32), np.asarray(ids, dtype=np.int64))
+                return
+
+            self._pending_ids.extend(ids)
+            self._pending.extend(vectors)
+            if len(self._pending) < self._train_size:
+                return
+
+            # Snapshot the buffers and swap in empty ones before handing them to the worker thread
+            ids, vectors = self._pending_ids, self._pending
+            self._pending_ids, self._pending = [], []
+            try:
+                await asyncio.to_thread(self._train_and_add, ids, vectors)
+            except Exception:
+                # Keep the vectors buffered (and searchable) for the next training attempt
+                self._pending_ids, self._pending = ids + self._pending_ids, vectors + self._pending
+                raise
+
+    def _train_and_add(self, ids: List[int], vectors: List[List[float]]):
+        vecs = np.asarray(vectors, dtype=np.float32)
+        self.index.train(vecs)
+        self.index.add_with_ids(vecs, np.asarray(ids, dtype=np.int64))
+        logger.info(f"[VectorMemory] IVF-PQ index trained on {len(ids)} vectors")
 
     async def search_vector(self, session_id: str, query_vector: List[float], top_k: int = 5):
-        logger.debug(f"[VectorMemory] search_vector placeholder.")
-        return []
+        if self.index is None:
+            logger.debug(f"[VectorMemory] search_vector placeholder.")
+            return []
+        async with self._lock:
+            return await asyncio.to_thread(self._search, session_id, query_vector, top_k)
+
+    def _search(self, session_id: str, query_vector: List[float], top_k: int) -> List[Dict[str, Any]]:
+        query = np.asarray([query_vector], dtype=np.float32)
+        hits: List[Tuple[float, int]] = []
+
+        if self.index.ntotal:
+            # The index is shared by all sessions: over-fetch, then keep this session's hits
+            distances, ids = self.index.search(query, min(top_k * 4, self.index.ntotal))
+            hits.extend((float(d), int(i)) for d, i in zip(distances[0], ids[0]) if i >= 0)
+
+        if self._pending:
+            # Not trained yet: exact scan of the buffered vectors
+            dists = ((np.asarray(self._pending, dtype=np.float32) - query) ** 2).sum(axis=1)
+            hits.extend(zip(dists.tolist(), self._pending_ids))
+
+        results = []
+        for dist, vid in sorted(hits):
+            owner, metadata = self._meta.get(vid, (None, {}))
+            if owner != session_id:
+                continue
+            results.append({"id": vid, "score": dist, "metadata": metadata})
+            if len(results) >= top_k:
+                break
+        return results
@@ -1,8 +1,13 @@
 # nodes/greeting_node.py
+import re
+from langgraph.config import get_stream_writer
 from core.base_node import BaseNode
 from core.logger import log_info, log_error
 from agents.hello_agent import HelloAgent
 
+_WORD_RE = re.compile(r"[a-z']+")
+_BYE_RE = re.compile(r"\b(?:bye|goodbye|see you)\b")  # "see you" is a phrase, so match on the text
+
 
 class GreetingNode(BaseNode):
     """
@@ -14,6 +19,8 @@ class GreetingNode(BaseNode):
     description = "Handles greeting messages and invokes an Agent for LLM response"
     node_type = "node"
 
+    _HELLO = frozenset({"hi", "hello", "hey", "morning"})
+
     def __init__(self, agent=None):
         super().__init__(agent=agent or HelloAgent())
 
@@ -21,10 +28,11 @@ class GreetingNode(BaseNode):
         query = (state.get("query") or "").strip()
         log_info(f"[{self.name}] executing.", query=query)
 
-        # ---- Step 1: Rule-based greeting ----
-        if any(word in query.lower() for word in ["hi", "hello", "hey", "morning"]):
+        # ---- Step 1: Rule-based greeting (whole words, lowercased once) ----
+        query_lower = query.lower()
+        if not self._HELLO.isdisjoint(_WORD_RE.findall(query_lower)):
             greeting = "Hello there 👋! Let me think about that for you..."
-        elif any(word in query.lower() for word in ["bye", "goodbye", "see you"]):
+        elif _BYE_RE.search(query_lower):
             greeting = "Goodbye! Have a great day ahead 👋"
             return {"query": query, "response": greeting}
         else:
@@ -33,10 +41,13 @@ class GreetingNode(BaseNode):
         # ---- Step 2: Call injected Agent ----
         try:
             # ✅ Pass both query and full state
-            agent_result = await self.agent.run(query, state)
+            if state.get("stream"):
+                agent_result = await self._stream_agent(query, state)
+            else:
+                agent_result = await self.agent.run(query, state)
             log_info(f"[{self.name}] successfully called {self.agent.__class__.__name__}.", query=query)
 
-            # Merge outputs
+            # Merge outputs (StateGraph(dict) replaces the whole state, so one merge per call)
             return {
                 **state,
                 "query": query,
@@ -55,3 +66,14 @@ class GreetingNode(BaseNode):
                 "error": str(e),
                 "llm_used": False,
             }
+
+    async def _stream_agent(self, query: str, state: dict) -> dict:
+        """Forward agent deltas to the LangGraph custom stream and return the final output."""
+        writer = get_stream_writer()
+        agent_result: dict = {}
+        async for chunk in self.agent.stream_run(query, state):
+            if "delta" in chunk:
+                writer(chunk)
+            else:
+                agent_result = chunk
+        return agent_result
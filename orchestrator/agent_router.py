@@ -1,10 +1,15 @@
 import os
-import yaml
-import json
-from typing import Dict, Any, Optional
+import orjson
+from typing import Dict, Any, List, Optional, Tuple
 from providers.llm_service_provider import get_llm_service
 from core.logger import get_logger, log_info, log_warning, log_error, log_debug
 from core.exceptions import ConfigError
+from core.yaml_cache import load_yaml_cached
+
+try:
+    import ahocorasick  # optional: pyahocorasick, single-pass multi-keyword matching
+except ImportError:  # pragma: no cover - falls back to a per-keyword scan
+    ahocorasick = None
 
 logger = get_logger("AgentRouter")
 
@@ -21,6 +26,12 @@ class AgentRouter:
         self.default_domain = default_domain
         self.llm = get_llm_service()
         self.intent_configs = self._load_all_domains()
+        # Keyword matchers are precompiled once per domain (keywords lowercased at load time)
+        self.intent_flat = {d: self._flatten_keywords(i) for d, i in self.intent_configs.items()}
+        self._prompt_prefix = {d: self._build_prompt_prefix(d, i) for d, i in self.intent_configs.items()}
+        self.intent_automata = (
+            {d: self._build_automaton(kws) for d, kws in self.intent_flat.items()} if ahocorasick else {}
+        )
 
         log_info(
             "AgentRouter initialized.",
@@ -36,27 +47,30 @@ class AgentRouter:
         if not os.path.exists(self.base_dir):
             raise ConfigError(f"Base directory not found: {self.base_dir}")
 
-        for d in os.listdir(self.base_dir):
-            domain_path = os.path.join(self.base_dir, d)
-            if not os.path.isdir(domain_path):
-                continue  # skip non-directory files
-
-            intent_path = os.path.join(domain_path, "intents.yaml")
-            if not os.path.exists(intent_path):
-                log_warning("No intents.yaml found for domain.", domain=d)
-                continue
-
-            try:
-                with open(intent_path, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f) or {}
+        # scandir: DirEntry caches the type info, so discovery needs one stat() per intents.yaml
+        with os.scandir(self.base_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue  # skip non-directory files
+
+                d = entry.name
+                intent_path = os.path.join(entry.path, "intents.yaml")
+                try:
+                    mtime_ns = os.stat(intent_path).st_mtime_ns
+                except FileNotFoundError:
+                    log_warning("No intents.yaml found for domain.", domain=d)
+                    continue
+
+                try:
+                    data = load_yaml_cached(intent_path, mtime_ns) or {}
                     intents = data.get("intents", {})
                     if intents:
                         domains[d] = intents
                         log_info("Loaded domain intents.", domain=d, count=len(intents))
                     else:
                         log_warning("Empty or invalid intents.yaml.", domain=d, path=intent_path)
-            except Exception as e:
-                log_error("Failed to load domain intents.", domain=d, error=str(e), path=intent_path)
+                except Exception as e:
+                    log_error("Failed to load domain intents.", domain=d, error=str(e), path=intent_path)
 
         if not domains:
             raise ConfigError(f"No valid domain configurations found in '{self.base_dir}'")
@@ -80,17 +94,17 @@ class AgentRouter:
         log_debug("Starting intent classification.", domain=domain, query=query)
 
         # 1️⃣ Rule-based keyword matching
-        for intent, meta in intents.items():
-            for kw in meta.get("keywords", []):
-                if kw.lower() in query_lower:
-                    log_info("Rule-based intent matched.", domain=domain, intent=intent, keyword=kw)
-                    return {
-                        "domain": domain,
-                        "intent": intent,
-                        "confidence": 1.0,
-                        "method": "rule",
-                        "matched_keyword": kw,
-                    }
+        matched = self._match_keyword(domain, query_lower)
+        if matched:
+            intent, kw = matched
+            log_info("Rule-based intent matched.", domain=domain, intent=intent, keyword=kw)
+            return {
+                "domain": domain,
+                "intent": intent,
+                "confidence": 1.0,
+                "method": "rule",
+                "matched_keyword": kw,
+            }
 
         # 2️⃣ LLM-based classification (fallback)
         try:
@@ -125,12 +139,61 @@ class AgentRouter:
             "method": "default",
         }
 
+    # Keyword matching helpers
+    @staticmethod
+    def _flatten_keywords(intents: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+        """[(intent, keyword_lower, keyword)] in YAML precedence order; blank keywords are dropped."""
+        return [
+            (intent, kw.lower(), kw)
+            for intent, meta in intents.items()
+            for kw in (meta or {}).get("keywords", [])
+            if kw and kw.strip()
+        ]
+
+    @staticmethod
+    def _build_automaton(flat: List[Tuple[str, str, str]]):
+        """Aho-Corasick automaton whose values carry (priority, intent, keyword)."""
+        aho = ahocorasick.Automaton()
+        for priority, (intent, kw_lower, kw) in enumerate(flat):
+            # Keep the first (highest-priority) owner of a duplicated keyword
+            if kw_lower not in aho:
+                aho.add_word(kw_lower, (priority, intent, kw))
+        aho.make_automaton()
+        return aho
+
+    def _match_keyword(self, domain: str, query_lower: str) -> Optional[Tuple[str, str]]:
+        """
+        Return (intent, keyword) for the first keyword in YAML order found in the query.
+        The automaton scans the query once; taking the lowest priority among its hits
+        keeps the same precedence as checking intents/keywords in order.
+        """
+        aho = self.intent_automata.get(domain)
+        if aho is not None:
+            if not len(aho):
+                return None
+            best = min((value for _, value in aho.iter(query_lower)), default=None)
+            return (best[1], best[2]) if best else None
+
+        # Fallback without pyahocorasick: one flat, pre-lowercased list, first hit wins
+        for intent, kw_lower, kw in self.intent_flat[domain]:
+            if kw_lower in query_lower:
+                return intent, kw
+        return None
+
     def _build_llm_prompt(self, query: str, domain: str, intents: Dict[str, Any]) -> str:
-        """Build structured LLM classification prompt."""
+        """Build structured LLM classification prompt (static per-domain prefix + query)."""
+        prefix = self._prompt_prefix.get(domain)
+        if prefix is None:
+            prefix = self._prompt_prefix[domain] = self._build_prompt_prefix(domain, intents)
+        return prefix + query
+
+    @staticmethod
+    def _build_prompt_prefix(domain: str, intents: Dict[str, Any]) -> str:
+        """Everything in the classification prompt that does not depend on the query."""
         options = list(intents.keys())
         descs = [f"{k}: {v.get('description', '')}" for k, v in intents.items()]
 
-        log_debug("Building LLM prompt for classification.", domain=domain, intent_options=options)
+        log_debug("Building LLM prompt prefix for classification.", domain=domain, intent_options=options)
 
         return f"""
         You are an intent classifier for the domain '{domain}'.
@@ -148,8 +211,7 @@ class AgentRouter:
           "confidence": float (0.0 - 1.0)
         }}
 
-        Query: {query}
-        """
+        Query: """
 
     def _safe_parse(self, raw: Any) -> Dict[str, Any]:
         """Safely parse JSON output from the LLM."""
@@ -157,9 +219,9 @@ class AgentRouter:
             return raw
 
         try:
-            parsed = json.loads(str(raw))
+            parsed = orjson.loads(str(raw))
             log_debug("LLM output parsed successfully.", output=parsed)
             return parsed
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             log_warning("LLM returned non-JSON output; fallback used.", raw_output=str(raw))
             return {"intent": "qa", "confidence": 0.5}
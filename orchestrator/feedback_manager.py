@@ -1,5 +1,5 @@
 from typing import Dict, Any, Optional, Callable
-from datetime import datetime
+import time
 from core.logger import get_logger, log_info, log_error, log_debug, log_warning
 from core.exceptions import NodeError
 
@@ -33,7 +33,9 @@ class FeedbackManager:
         """
         session_id = inputs.get("session_id", "unknown")
         decision = inputs.get("decision", "ok")
-        score = float(inputs.get("score", 0.8))
+        score = inputs.get("score", 0.8)
+        if not isinstance(score, (int, float)):
+            score = float(score)
         comment = inputs.get("comment", "")
         source = inputs.get("source", "system")
 
@@ -43,7 +45,7 @@ class FeedbackManager:
             "score": score,
             "comment": comment,
             "source": source,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp_ns": time.time_ns(),  # epoch nanoseconds; format on read if needed
         }
 
         # ---- Log feedback ----
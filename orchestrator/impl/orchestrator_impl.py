@@ -1,5 +1,6 @@
 import asyncio
-from typing import Dict, Any, Optional
+import os
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
 from orchestrator.orchestrator_interface import OrchestratorInterface
 from orchestrator.agent_router import AgentRouter
@@ -22,8 +23,10 @@ class OrchestratorImpl(OrchestratorInterface):
 
     def __init__(self):
         self.router = AgentRouter()           # pre-load all domain configs
-        self.builder = LangGraphBuilder()
         self.state_manager = StateManager()
+        self.builder = LangGraphBuilder(state_manager=self.state_manager)
+        # (domain, intent) -> (workflow file mtime_ns, compiled graph); rebuilt when the YAML changes
+        self._compiled: Dict[Tuple[str, str], Tuple[int, Any]] = {}
         log_info("Orchestrator initialized successfully.")
 
     # ---- main entrypoint ----
@@ -58,8 +61,8 @@ class OrchestratorImpl(OrchestratorInterface):
             final = await self.post_process(result, session_id, resolved_domain)
             log_debug("Post-processing done.", session_id=session_id, domain=resolved_domain)
 
-            # --- Persist updated state ---
-            await self.state_manager.save_state(session_id, final)
+            # --- Persist updated state + semantic memory (independent writes, run concurrently) ---
+            await self._persist(session_id, result, final)
             log_info("Session state persisted.", session_id=session_id, domain=resolved_domain)
 
             return {
@@ -72,6 +75,55 @@ class OrchestratorImpl(OrchestratorInterface):
             log_error("Error in orchestrator pipeline.", session_id=session_id, domain=domain, error=str(e))
             return await self.on_error(e, session_id, domain)
 
+    # ---- streaming entrypoint ----
+    async def stream_user_query(
+        self, session_id: str, query: str, domain: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming counterpart of `handle_user_query`.
+        Yields `{"delta": str}` chunks emitted by graph nodes while the workflow runs,
+        then a final `{"domain", "intent", "result"}` dict (or the `on_error` payload).
+        """
+        log_info("Received streaming user query.", session_id=session_id, query=query, domain=domain or self.router.default_domain)
+
+        try:
+            clean_query = await self.pre_process(query, session_id)
+            route = await self.router.classify_intent(clean_query, domain=domain)
+            intent = route.get("intent", "qa")
+            resolved_domain = route.get("domain", domain or self.router.default_domain)
+            log_info("Intent classified.", session_id=session_id, domain=resolved_domain, intent=intent, method=route.get("method"))
+
+            compiled, inputs = await self._prepare_graph(intent, clean_query, session_id, resolved_domain)
+            inputs["stream"] = True  # nodes forward agent deltas through the LangGraph stream writer
+
+            result: Dict[str, Any] = inputs
+            try:
+                async for mode, chunk in compiled.astream(inputs, stream_mode=["custom", "values"]):
+                    if mode == "custom":
+                        yield chunk
+                    else:
+                        result = chunk
+            except Exception as e:
+                log_error("Graph stream failed.", intent=intent, domain=resolved_domain, session_id=session_id, error=str(e))
+                raise NodeError("Graph execution failed.", context={"intent": intent, "domain": resolved_domain, "session": session_id}) from e
+
+            result.pop("stream", None)
+            log_info("Graph stream complete.", session_id=session_id, domain=resolved_domain, intent=intent)
+
+            final = await self.post_process(result, session_id, resolved_domain)
+            await self._persist(session_id, result, final)
+            log_info("Session state persisted.", session_id=session_id, domain=resolved_domain)
+
+            yield {
+                "domain": resolved_domain,
+                "intent": intent,
+                "result": final,
+            }
+
+        except Exception as e:
+            log_error("Error in orchestrator stream pipeline.", session_id=session_id, domain=domain, error=str(e))
+            yield await self.on_error(e, session_id, domain)
+
     # ---- workflow execution ----
     async def run_graph(self, intent: str, query: str, session_id: str, domain: str) -> Dict[str, Any]:
         """
@@ -79,32 +131,60 @@ class OrchestratorImpl(OrchestratorInterface):
         Responsible for loading state, building the graph, and running it asynchronously.
         """
         try:
-            # --- Load prior state ---
-            state = await self.state_manager.load_state(session_id)
-            log_debug("State loaded for session.", session_id=session_id)
-
-            # --- Build LangGraph workflow ---
-            graph = await self.builder.build_graph(intent, domain=domain)
-            compiled = graph.compile()
-            log_info("LangGraph constructed.", domain=domain, intent=intent, nodes=len(graph.nodes))
-
-            # --- Prepare execution input ---
-            inputs = {"query": query, "domain": domain, **state}
-            log_debug("Executor inputs prepared.", session_id=session_id, domain=domain)
+            compiled, inputs = await self._prepare_graph(intent, query, session_id, domain)
 
             # --- Run workflow (async invoke) ---
             result = await compiled.ainvoke(inputs)
             log_info("Graph execution complete.", session_id=session_id, domain=domain, intent=intent)
-
-            # --- Update vector memory (optional) ---
-            await self.state_manager.update_memory(session_id, result)
-
             return result
 
         except Exception as e:
             log_error("Graph execution failed.", intent=intent, domain=domain, session_id=session_id, error=str(e))
             raise NodeError("Graph execution failed.", context={"intent": intent, "domain": domain, "session": session_id}) from e
 
+    async def _prepare_graph(self, intent: str, query: str, session_id: str, domain: str) -> Tuple[Any, Dict[str, Any]]:
+        """Load prior session state and fetch (or build + compile) the workflow graph."""
+        # --- Load prior state ---
+        state = await self.state_manager.load_state(session_id)
+        log_debug("State loaded for session.", session_id=session_id)
+
+        # --- Build LangGraph workflow (compiled once per workflow file version) ---
+        compiled = await self._get_compiled_graph(intent, domain)
+
+        # --- Prepare execution input ---
+        inputs = {"query": query, "domain": domain, **state}
+        log_debug("Executor inputs prepared.", session_id=session_id, domain=domain)
+        return compiled, inputs
+
+    async def _persist(self, session_id: str, result: Dict[str, Any], final: Dict[str, Any]):
+        """
+        Save session state and update semantic memory concurrently.
+        Both writes always run to completion; the first failure is re-raised for `on_error`.
+        """
+        outcomes = await asyncio.gather(
+            self.state_manager.update_memory(session_id, result),
+            self.state_manager.save_state(session_id, final),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+    async def _get_compiled_graph(self, intent: str, domain: str) -> Any:
+        """Return the compiled graph for (domain, intent), rebuilding it only after its YAML changes."""
+        key = (domain or self.builder.default_domain, intent)
+        mtime_ns = os.stat(self.builder.config_path(domain)).st_mtime_ns
+
+        cached = self._compiled.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        graph = await self.builder.build_graph(intent, domain=domain)
+        compiled = graph.compile()
+        self._compiled[key] = (mtime_ns, compiled)
+        log_info("LangGraph constructed.", domain=domain, intent=intent, nodes=len(graph.nodes))
+        return compiled
+
     # ---- optional lifecycle hooks ----
     async def pre_process(self, query: str, session_id: str) -> str:
         """Normalize or clean user query before routing."""
@@ -1,31 +1,41 @@
 import os
-import yaml
 import inspect
+import functools
+from typing import Callable, Dict, Tuple
 from langgraph.graph import StateGraph
 from core.logger import get_logger, log_info, log_error, log_debug, log_warning
 from core.registry import AgentRegistry, NodeRegistry
 from orchestrator.reflection_node import ReflectionNode
 from orchestrator.feedback_manager import FeedbackManager
 from core.exceptions import ConfigError, NodeError
+from core.yaml_cache import load_yaml_cached
 
 logger = get_logger("LangGraphBuilder")
 
 
+async def _sync_to_async(handler: Callable, inputs: dict):
+    """Shared shim that lets LangGraph await a synchronous node handler."""
+    return handler(inputs)
+
+
 class LangGraphBuilder:
     """
     Dynamically builds LangGraph workflows from YAML configuration files.
     Supports multi-domain workflows under data/<domain>/workflows/*.yaml.
     """
 
-    def __init__(self, base_dir: str = "data", default_domain: str = "hello"):
+    def __init__(self, base_dir: str = "data", default_domain: str = "hello", state_manager=None):
         self.base_dir = base_dir
         self.default_domain = default_domain
+        self.state_manager = state_manager  # handed to nodes that record session memory (ReflectionNode)
+        # (node_type, class_name) -> ready-to-add async node callable, shared across graph builds
+        self._handler_cache: Dict[Tuple[str, str], Callable] = {}
         log_info("LangGraphBuilder initialized.", base_dir=self.base_dir, default_domain=self.default_domain)
 
-    # Load workflow configuration for a domain
-    def load_config(self, domain: str) -> dict:
+    # Resolve the workflow file for a domain
+    def config_path(self, domain: str) -> str:
         """
-        Load YAML workflow configuration for the given domain.
+        Return the workflow YAML path for the given domain (falling back to the default domain).
         Example: data/dealer/workflows/dealer_workflow.yaml
         """
         domain = domain or self.default_domain
@@ -43,12 +53,19 @@ class LangGraphBuilder:
         if not os.path.exists(config_path):
             log_error("Workflow configuration file not found.", path=config_path)
             raise ConfigError(f"Workflow file not found for domain '{domain}'")
+        return config_path
+
+    # Load workflow configuration for a domain
+    def load_config(self, domain: str) -> dict:
+        """Load YAML workflow configuration for the given domain."""
+        domain = domain or self.default_domain
+        config_path = self.config_path(domain)
 
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
-                log_debug("Workflow configuration loaded.", domain=domain, path=config_path)
-                return data
+            # Parsed once per file version; later queries reuse the cached document
+            data = load_yaml_cached(config_path) or {}
+            log_debug("Workflow configuration loaded.", domain=domain, path=config_path)
+            return data
         except Exception as e:
             log_error("Failed to load workflow configuration.", domain=domain, path=config_path, error=str(e))
             raise ConfigError("Failed to load workflow configuration.") from e
@@ -82,12 +99,7 @@ class LangGraphBuilder:
 
             try:
                 handler = await self._resolve_handler(node_type, class_name)
-                if not inspect.iscoroutinefunction(handler):
-                    async def async_wrapper(inputs, h=handler):
-                        return h(inputs)
-                    g.add_node(node_name, async_wrapper)
-                else:
-                    g.add_node(node_name, handler)
+                g.add_node(node_name, handler)
 
             except Exception as e:
                 raise NodeError(f"Failed to initialize node '{node_name}' in domain '{domain}': {e}") from e
@@ -116,22 +128,34 @@ class LangGraphBuilder:
 
     # Internal helper
     async def _resolve_handler(self, node_type: str, class_name: str):
-        """Resolve and instantiate the correct node handler."""
+        """
+        Resolve the node handler, instantiating its class only on first use.
+        Sync handlers are wrapped once so every cached entry is awaitable.
+        """
+        key = (node_type, class_name)
+        handler = self._handler_cache.get(key)
+        if handler is None:
+            handler = self._instantiate_handler(node_type, class_name)
+            if not inspect.iscoroutinefunction(handler):
+                handler = functools.partial(_sync_to_async, handler)
+            self._handler_cache[key] = handler
+        return handler
+
+    def _instantiate_handler(self, node_type: str, class_name: str) -> Callable:
+        """Instantiate the node class and return its entry-point method."""
         if node_type == "agent":
-            agent_cls = AgentRegistry.get(class_name)
-            if not agent_cls:
+            if not AgentRegistry.get(class_name):
                 raise ValueError(f"Agent class '{class_name}' not registered.")
-            return agent_cls().run
+            return AgentRegistry.create_instance(class_name).run
 
         elif node_type == "node":
             if class_name == "ReflectionNode":
-                return ReflectionNode().run
+                return ReflectionNode(state_manager=self.state_manager).run
             elif class_name == "FeedbackManager":
                 return FeedbackManager().collect_feedback
             else:
-                custom_node_cls = NodeRegistry.get(class_name)
-                if not custom_node_cls:
+                if not NodeRegistry.get(class_name):
                     raise ValueError(f"Custom node '{class_name}' not registered.")
-                return custom_node_cls().execute
+                return NodeRegistry.create_instance(class_name).execute
 
         raise ValueError(f"Unknown node type '{node_type}'")
@@ -1,6 +1,6 @@
 # orchestrator/orchestrator_interface.py
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 
 class OrchestratorInterface(ABC):
@@ -11,13 +11,21 @@ class OrchestratorInterface(ABC):
 
     # ---- Core entrypoints ----
     @abstractmethod
-    async def handle_user_query(self, session_id: str, query: str) -> Dict[str, Any]:
+    async def handle_user_query(self, session_id: str, query: str, domain: Optional[str] = None) -> Dict[str, Any]:
         """
         Main entrypoint for handling a user query.
         Responsible for intent detection, routing, and invoking the correct workflow.
         """
         pass
 
+    async def stream_user_query(self, session_id: str, query: str, domain: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Optional: streaming variant of `handle_user_query`.
+        Yields incremental `{"delta": ...}` chunks, then the final result dict.
+        Default implementation yields the non-streamed result once.
+        """
+        yield await self.handle_user_query(session_id, query, domain=domain)
+
     @abstractmethod
     async def run_graph(self, intent: str, query: str, session_id: str) -> Dict[str, Any]:
         """
@@ -1,11 +1,11 @@
-from functools import lru_cache
+from core.singleton import singleton
 from orchestrator.impl.orchestrator_impl import OrchestratorImpl
 from core.logger import get_logger, log_error
 from core.exceptions import MCPRuntimeError
 
 logger = get_logger("OrchestratorProvider")
 
-@lru_cache(maxsize=1)
+@singleton
 def get_orchestrator_service() -> OrchestratorImpl:
     """Global singleton provider for the Orchestrator service."""
     try:
@@ -1,20 +1,111 @@
-from typing import Dict, Any
-import json
-from core.logger import get_logger, log_error
+import asyncio
+import hashlib
+import re
+from typing import Dict, Any, Optional
+import msgspec
+from core.cache import TTLCache
+from core.config import CurrentConfig
+from core.context import get_request_context
+from core.logger import get_logger, log_error, log_info, log_warning
 from core.exceptions import NodeError
 from providers.llm_service_provider import get_llm_service
 
 logger = get_logger("ReflectionNode")
 
 
+# Structured-output schema for review verdicts: the model must return exactly this shape
+_VERDICT_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "reflection_verdict",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "score": {"type": "number"},
+                "decision": {"type": "string", "enum": ["ok", "reask"]},
+                "comment": {"type": "string"},
+            },
+            "required": ["score", "decision", "comment"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+class Verdict(msgspec.Struct):
+    """Decoded review verdict; missing fields fall back per decision in `ReflectionNode.run`."""
+
+    decision: str = "ok"
+    score: Optional[float] = None
+    comment: str = ""
+
+
+# Unparseable model output is treated as a pass
+_UNPARSED_VERDICT = Verdict(decision="ok", score=0.8, comment="Could not parse; assumed OK.")
+
+# Prompt templates, defined once (literal braces are doubled for str.format_map)
+_REVIEW_TEMPLATE = (
+    "You are a strict evaluator of AI responses.\n\n"
+    "Evaluate the assistant's answer for the given question.\n\n"
+    "Question: {query}\n"
+    "Answer: {answer}\n\n"
+    "Return JSON:\n"
+    "{{\n"
+    '  "score": float (0.0 - 1.0),\n'
+    '  "decision": "ok" or "reask",\n'
+    '  "comment": "Explain your reasoning in one line."\n'
+    "}}\n"
+)
+_CLARIFY_TEMPLATE = "Generate a short follow-up question to clarify: {query}"
+
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.MULTILINE)
+
+
+# ---- Local pre-review heuristic ----
+# "I'm unable" / "I am unable", "I cannot" / "I can't" / "I can not", "I don't know";
+# apostrophes may be straight (') or typographic (’)
+_REFUSAL_RE = re.compile(r"(?i)\bi(?:['’]m| am) unable|\bi can(?:not|['’]?t| not)\b|\bi don['’]?t know")
+_TOKEN_RE = re.compile(r"\w+")
+_LOCAL_OK_SCORE = 0.95
+
+
+def _local_score(query: str, answer: str) -> float | None:
+    """
+    Cheap confidence check for answers that clearly need no LLM review:
+    substantial length, no refusal phrasing, and query/answer token overlap
+    (Jaccard) above 0.15. Returns a score when confident, else None.
+    """
+    if len(answer) <= 40 or _REFUSAL_RE.search(answer):
+        return None
+    q_tokens = set(_TOKEN_RE.findall(query.lower()))
+    a_tokens = set(_TOKEN_RE.findall(answer.lower()))
+    if not q_tokens:
+        return None
+    overlap = len(q_tokens & a_tokens) / len(q_tokens | a_tokens)
+    return _LOCAL_OK_SCORE if overlap > 0.15 else None
+
+
+def _digest(*parts: str) -> bytes:
+    """Compact 16-byte cache key for the given text parts."""
+    return hashlib.blake2b("\x00".join(parts).encode("utf-8"), digest_size=16).digest()
+
+
 class ReflectionNode:
     """
     ReflectionNode: evaluates AI answers for quality and correctness.
     Built for integration into LangGraph as a self-evaluation node.
     """
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 1024, state_manager=None):
         self.llm = get_llm_service()
+        # Optional StateManager: the reviewed answer is appended to session memory
+        # while the review runs, instead of after it
+        self.state_manager = state_manager
+        # Parsed verdicts per (query, answer) and clarifications per query; repeats
+        # (retry loops, graph reruns) skip the LLM entirely
+        self._verdict_cache = TTLCache(maxsize=cache_size)
+        self._clarify_cache = TTLCache(maxsize=cache_size)
+        self.local_review = CurrentConfig.REFLECTION_LOCAL_REVIEW
 
     async def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -29,78 +120,115 @@ class ReflectionNode:
         answer = inputs.get("previous_output", "") or inputs.get("answer", "")
 
         if not answer:
-            logger.warning("No answer found — skipping reflection.", query=query)
+            log_warning("No answer found — skipping reflection.", query=query)
             return {"decision": "ok", "score": 1.0, "comment": "No answer to review."}
 
-        # ---- Build Review Prompt ----
-        review_prompt = f"""
-        You are a strict evaluator of AI responses.
-
-        Evaluate the assistant's answer for the given question.
-
-        Question: {query}
-        Answer: {answer}
+        memory_task = self._start_memory_write(answer)
+        try:
+            return await self._review(query, answer)
+        finally:
+            if memory_task is not None:
+                await memory_task
+
+    async def _review(self, query: str, answer: str) -> Dict[str, Any]:
+        """Verdict for one (query, answer) pair: cache, local heuristic, then LLM review."""
+        verdict_key = _digest(query, answer)
+        cached = self._verdict_cache.get(verdict_key)
+        if cached is not None:
+            logger.debug("Reflection verdict served from cache.")
+            return dict(cached)
+
+        # ---- Local Pre-review ----
+        # Clearly on-topic answers are accepted without paying for an LLM round-trip
+        if self.local_review:
+            score = _local_score(query, answer)
+            if score is not None:
+                logger.debug("Reflection accepted by local heuristic.")
+                return {"decision": "ok", "score": score, "comment": "Accepted by local heuristic review."}
 
-        Return JSON:
-        {{
-          "score": float (0.0 - 1.0),
-          "decision": "ok" or "reask",
-          "comment": "Explain your reasoning in one line."
-        }}
-        """
+        # ---- Build Review Prompt ----
+        review_prompt = _REVIEW_TEMPLATE.format_map({"query": query, "answer": answer})
 
         # ---- LLM Evaluation ----
+        # The clarification only depends on the query, so start it speculatively alongside
+        # the review; a reask then costs one LLM round-trip instead of two.
+        clarify_task = asyncio.create_task(self._generate_clarification(query))
         try:
-            raw = await self.llm.apredict(review_prompt)
+            raw = await self.llm.apredict(review_prompt, response_format=_VERDICT_FORMAT)
             parsed = self._safe_parse(raw)
         except Exception as e:
+            clarify_task.cancel()
             log_error("Reflection evaluation failed.", error=str(e), query=query)
             raise NodeError("Reflection LLM evaluation failed.", context={"query": query}) from e
 
         # ---- Decision Handling ----
-        if parsed.get("decision") == "reask":
-            clarification = await self._generate_clarification(query)
+        if parsed.decision == "reask":
+            clarification = await clarify_task
             result = {
                 "decision": "reask",
                 "clarify_question": clarification,
-                "score": parsed.get("score", 0.6),
-                "comment": parsed.get("comment", ""),
+                "score": 0.6 if parsed.score is None else parsed.score,
+                "comment": parsed.comment,
             }
-            logger.info("Reask triggered.", query=query, clarify_question=clarification)
+            log_info("Reask triggered.", query=query, clarify_question=clarification)
+            self._verdict_cache.set(verdict_key, dict(result))
             return result
 
         # ---- Normal Path ----
+        clarify_task.cancel()  # speculative clarification not needed
         result = {
             "decision": "ok",
-            "score": parsed.get("score", 0.9),
-            "comment": parsed.get("comment", ""),
+            "score": 0.9 if parsed.score is None else parsed.score,
+            "comment": parsed.comment,
         }
-        logger.info("Reflection complete.", query=query, score=result["score"])
+        log_info("Reflection complete.", query=query, score=result["score"])
+        self._verdict_cache.set(verdict_key, dict(result))
         return result
 
     # ---- Helpers ----
+    def _start_memory_write(self, answer: str) -> asyncio.Task | None:
+        """Append the answer to the current session's memory in the background (if wired)."""
+        session_id = get_request_context().get("session_id")
+        if self.state_manager is None or not session_id:
+            return None
+        return asyncio.create_task(self._append_answer(session_id, answer))
+
+    async def _append_answer(self, session_id: str, answer: str):
+        try:
+            await self.state_manager.append_message(session_id, "assistant", str(answer))
+        except Exception as e:
+            # Memory is best-effort here: never fail the reflection because of it
+            log_warning("Reflection memory write failed.", session_id=session_id, error=str(e))
+
     async def _generate_clarification(self, query: str) -> str:
         """Generate a follow-up question for clarification."""
-        clarify_prompt = f"Generate a short follow-up question to clarify: {query}"
+        key = _digest(query)
+        cached = self._clarify_cache.get(key)
+        if cached is not None:
+            return cached
+
+        clarify_prompt = _CLARIFY_TEMPLATE.format_map({"query": query})
         try:
-            clarification = await self.llm.apredict(clarify_prompt)
-            return clarification.strip()
+            clarification = (await self.llm.apredict(clarify_prompt)).strip()
+            self._clarify_cache.set(key, clarification)
+            return clarification
+        except asyncio.CancelledError:
+            return ""  # speculative call discarded by run()
         except Exception:
             log_error("Clarification generation failed.", query=query)
             return f"Could you clarify your question about: {query}?"
 
-    def _safe_parse(self, raw: Any) -> Dict[str, Any]:
-        """Safely parse the LLM output into JSON."""
-        if isinstance(raw, dict):
-            return raw
-
-        text = str(raw).strip()
+    def _safe_parse(self, raw: Any) -> Verdict:
+        """Safely decode the LLM output into a Verdict (JSON parsed straight into the struct)."""
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            logger.warning("Non-JSON response received.", raw=text)
-            return {
-                "score": 0.8,
-                "decision": "ok",
-                "comment": "Could not parse; assumed OK.",
-            }
+            if isinstance(raw, dict):
+                return msgspec.convert(raw, Verdict, strict=False)
+            # LLMs often wrap JSON in ```json ... ``` fences; strip them before parsing
+            text = _FENCE_RE.sub("", str(raw).strip())
+            # strict=False: tolerate numeric strings such as "score": "0.7"
+            return msgspec.json.decode(text, type=Verdict, strict=False)
+        except msgspec.ValidationError as e:
+            log_warning("Malformed verdict received.", raw=raw, error=str(e))
+        except msgspec.DecodeError:
+            log_warning("Non-JSON response received.", raw=raw)
+        return _UNPARSED_VERDICT
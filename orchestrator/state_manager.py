@@ -1,34 +1,81 @@
-from typing import Any, Dict, List, Optional
+import asyncio
+import weakref
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, get_args
 from core.message_schema import Message
-from core.logger import get_logger, log_debug, log_error, log_warning
+from core.logger import debug_enabled, get_logger, log_debug, log_error, log_warning
 from core.exceptions import MemoryError
+from core.memory_interface import MemoryInterface
 from core.registry import MemoryRegistry
 from core.config import CurrentConfig
+from core.context import spawn_background
 
 logger = get_logger("StateManager")
 
+# Allowed roles, taken from the Message schema so the two cannot drift apart
+_MESSAGE_ROLES = frozenset(get_args(Message.model_fields["role"].annotation))
+
 
 class StateManager:
     """
     Centralized session state and memory handler.
     Acts as the bridge between orchestrator and memory backend.
+
+    With STATE_WRITE_BEHIND enabled, `save_state` / `append_message` only enqueue the write;
+    a background flusher coalesces up to STATE_FLUSH_MAX_BATCH writes (or STATE_FLUSH_MS)
+    per backend round. Reads of a session first wait for that session's queued writes,
+    and `drain()` flushes everything (`drain_all()` also stops the workers on shutdown).
+
+    `update_memory` never blocks the request: turns are queued for a background worker
+    that embeds up to MEMORY_EMBED_BATCH texts per `embedder` call and stores the vectors
+    with one bulk write. Without an `embedder`, empty embeddings are stored (as before).
     """
 
-    def __init__(self):
-        self.memory = MemoryRegistry.get_active_memory()
-        logger.info(f"StateManager initialized with backend = {CurrentConfig.MEMORY_TYPE}")
+    # Instances with a started flusher or vector worker (drained and stopped by `drain_all()` on shutdown)
+    _writers: "weakref.WeakSet[StateManager]" = weakref.WeakSet()
+
+    def __init__(self, embedder: Optional[Callable[[List[str]], Awaitable[List[List[float]]]]] = None):
+        self.embedder = embedder  # async texts -> embeddings; None stores empty embeddings
+        self.write_behind = CurrentConfig.STATE_WRITE_BEHIND
+        self.max_batch = CurrentConfig.STATE_FLUSH_MAX_BATCH
+        self.flush_wait = CurrentConfig.STATE_FLUSH_MS / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._pending: Dict[str, int] = {}  # session_id -> queued writes not yet flushed
+        self._flushed: Optional[asyncio.Event] = None  # set (and replaced) after every flush
+        self.embed_batch = CurrentConfig.MEMORY_EMBED_BATCH
+        self._vectors: Optional[asyncio.Queue] = None
+        self._vector_worker: Optional[asyncio.Task] = None
+        logger.info(
+            f"StateManager initialized with backend = {CurrentConfig.MEMORY_TYPE}"
+            f" [write_behind={self.write_behind}]"
+        )
+
+    @property
+    def memory(self) -> MemoryInterface:
+        """
+        Active backend for the running event loop, looked up per call. StateManager is
+        built at import (outside any loop), so caching it here would pin the app to a
+        backend whose connections belong to no serving loop; MemoryRegistry caches it.
+        """
+        return MemoryRegistry.get_active_memory()
 
     # ---- Core state operations ----
     async def load_state(self, session_id: str) -> Dict[str, Any]:
+        if self._pending.get(session_id):
+            await self._wait_flushed(session_id)
         try:
             state = await self.memory.load_state(session_id)
-            log_debug("Loaded session state.", session_id=session_id, keys=list(state.keys()) if state else [])
+            if debug_enabled():  # the key list is only built when it will be logged
+                log_debug("Loaded session state.", session_id=session_id, keys=list(state) if state else [])
             return state or {}
         except Exception as e:
             log_error("Failed to load state.", session_id=session_id, error=str(e))
             raise MemoryError("Failed to load state.", context={"session_id": session_id}) from e
 
     async def save_state(self, session_id: str, state: Dict[str, Any]):
+        if self.write_behind:
+            self._enqueue("state", session_id, dict(state))
+            return
         try:
             await self.memory.save_state(session_id, state)
             log_debug("State saved successfully.", session_id=session_id, state_size=len(state))
@@ -45,14 +92,23 @@ class StateManager:
         metadata: Optional[Dict[str, Any]] = None,
     ):
         try:
-            message = Message(role=role, content=content, metadata=metadata or {})
-            await self.memory.append_message(session_id, role=message.role, content=message.content, metadata=message.metadata)
+            # Same checks as the Message schema, without building (and discarding) a pydantic model
+            if role not in _MESSAGE_ROLES:
+                raise ValueError(f"Invalid message role: {role!r}")
+            if not isinstance(content, str) or not content.strip():
+                raise ValueError("Message.content must be a non-empty string")
+            if self.write_behind:
+                self._enqueue("message", session_id, {"role": role, "content": content, "metadata": metadata or {}})
+                return
+            await self.memory.append_message(session_id, role=role, content=content, metadata=metadata or {})
             log_debug("Message appended to session memory.", session_id=session_id, role=role)
         except Exception as e:
             log_error("Failed to append message.", session_id=session_id, role=role, error=str(e))
             raise MemoryError("Failed to append message.", context={"session_id": session_id}) from e
 
     async def get_recent_messages(self, session_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        if self._pending.get(session_id):
+            await self._wait_flushed(session_id)
         try:
             msgs = await self.memory.get_messages(session_id, limit=limit)
             log_debug("Retrieved recent messages.", session_id=session_id, count=len(msgs))
@@ -63,19 +119,145 @@ class StateManager:
 
     # ---- Memory-level operations ----
     async def update_memory(self, session_id: str, result: Dict[str, Any]):
+        """Queue the turn for long-term memory; embedding and storage run in the background."""
         try:
             content = result.get("content") or str(result)
-            await self.memory.store_vector(session_id, embedding=[], metadata={"content": content})
-            log_debug("Semantic memory updated.", session_id=session_id)
+            if self._vector_worker is None or self._vector_worker.done():
+                self._vectors = self._vectors or asyncio.Queue()
+                self._vector_worker = spawn_background(self._vector_loop())
+                StateManager._writers.add(self)
+            self._vectors.put_nowait((session_id, content))
         except Exception as e:
             log_warning("Skipped memory update due to error.", session_id=session_id, error=str(e))
 
+    # ---- Write-behind queue ----
+    async def drain(self):
+        """Wait until every queued write (state, messages, vectors) has reached the memory backend."""
+        if self._writer is not None and not self._writer.done():
+            await self._queue.join()
+        if self._vector_worker is not None and not self._vector_worker.done():
+            await self._vectors.join()
+
+    async def aclose(self):
+        """Drain queued writes, then stop the background workers so none is left pending at loop close."""
+        await self.drain()
+        workers = [task for task in (self._writer, self._vector_worker) if task is not None and not task.done()]
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._writer = self._vector_worker = None
+        StateManager._writers.discard(self)
+
+    @classmethod
+    async def drain_all(cls):
+        """Drain and stop every StateManager with running background workers (FastAPI lifespan shutdown)."""
+        await asyncio.gather(*(sm.aclose() for sm in list(cls._writers)))
+
+    def _enqueue(self, op: str, session_id: str, payload: Dict[str, Any]):
+        if self._writer is None or self._writer.done():
+            # Started lazily (__init__ may run before an event loop exists), in a clean
+            # context so the long-lived writer does not keep this request's log context
+            self._queue = self._queue or asyncio.Queue()
+            if self._flushed is not None:
+                self._flushed.set()  # wake readers parked on a dead writer's event; they re-check
+            self._flushed = asyncio.Event()
+            self._writer = spawn_background(self._flusher())
+            StateManager._writers.add(self)
+        self._pending[session_id] = self._pending.get(session_id, 0) + 1
+        self._queue.put_nowait((op, session_id, payload))
+
+    async def _wait_flushed(self, session_id: str):
+        # Read-your-writes: only this session's queued writes are awaited
+        while self._pending.get(session_id):
+            await self._flushed.wait()
+
+    async def _next_batch(self, queue: asyncio.Queue, max_batch: int) -> list:
+        """Wait for one item, then collect more until `max_batch` items or the flush window ends."""
+        loop = asyncio.get_running_loop()
+        batch = [await queue.get()]
+        deadline = loop.time() + self.flush_wait
+
+        while len(batch) < max_batch:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _flusher(self):
+        while True:
+            batch = await self._next_batch(self._queue, self.max_batch)
+            try:
+                await self._flush(batch)
+            finally:
+                for _, session_id, _ in batch:
+                    remaining = self._pending.get(session_id, 1) - 1
+                    if remaining:
+                        self._pending[session_id] = remaining
+                    else:
+                        self._pending.pop(session_id, None)
+                    self._queue.task_done()
+                flushed, self._flushed = self._flushed, asyncio.Event()
+                flushed.set()
+
+    async def _flush(self, batch: List[Tuple[str, str, Dict[str, Any]]]):
+        # Coalesce: last state per session wins, messages keep their order per session
+        states: Dict[str, Dict[str, Any]] = {}
+        messages: Dict[str, List[Dict[str, Any]]] = {}
+        for op, session_id, payload in batch:
+            if op == "state":
+                states[session_id] = payload
+            else:
+                messages.setdefault(session_id, []).append(payload)
+
+        results = await asyncio.gather(
+            *(self.memory.save_state(sid, state) for sid, state in states.items()),
+            *(self.memory.append_messages_bulk(sid, msgs) for sid, msgs in messages.items()),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                log_error("Write-behind flush failed.", error=str(result))
+        log_debug("Write-behind batch flushed.", size=len(batch), states=len(states), sessions=len(messages))
+
+    # ---- Background long-term memory ----
+    async def _vector_loop(self):
+        # Own queue/worker: slow embedding calls never hold up state/message flushes
+        while True:
+            batch = await self._next_batch(self._vectors, self.embed_batch)
+            counts: Dict[str, int] = {}
+            for session_id, _ in batch:
+                counts[session_id] = counts.get(session_id, 0) + 1
+            try:
+                embeddings = await self._embed([content for _, content in batch])
+                await self.memory.store_vectors_bulk([
+                    (session_id, embedding, {"content": content})
+                    for (session_id, content), embedding in zip(batch, embeddings)
+                ])
+                for session_id, count in counts.items():
+                    log_debug("Semantic memory updated.", session_id=session_id, count=count)
+            except Exception as e:
+                for session_id, count in counts.items():
+                    log_warning("Skipped memory update due to error.", session_id=session_id, count=count, error=str(e))
+            finally:
+                for _ in batch:
+                    self._vectors.task_done()
+
+    async def _embed(self, texts: List[str]) -> List[List[float]]:
+        if self.embedder is None:
+            return [[] for _ in texts]
+        return await self.embedder(texts)
+
     # ---- Utility ----
     async def summarize_session(self, session_id: str) -> str:
-        msgs = await self.get_recent_messages(session_id)
+        # Only the last 5 messages are summarized, so fetch exactly those from the backend
+        msgs = await self.get_recent_messages(session_id, limit=5)
         if not msgs:
             return "No history available."
-        joined = " ".join([m["content"] for m in msgs[-5:]])
+        joined = " ".join(m["content"] for m in msgs)
         summary = f"Recent summary: {joined[:200]}"
         log_debug("Session summary generated.", session_id=session_id, length=len(summary))
         return summary
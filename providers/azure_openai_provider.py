@@ -1,24 +1,49 @@
 # src/providers/azure_openai_provider.py
 import os
-import traceback
+import httpx
+from typing import AsyncIterator
 from providers.base_provider import BaseLLMProvider
-from providers.configs.openai_config import azure_url_lookup
-from providers.utils.openai_client import post_openai_chat
+from providers.configs.openai_config import build_azure_url_lookup
+from providers.utils.openai_client import build_headers, post_openai_chat, stream_openai_chat
+from providers.utils.streaming import coalesce_stream
+from core.config import CurrentConfig
 from core.logger import get_logger
 
 logger = get_logger("AzureOpenAIProvider")
 
+_DEFAULT_MAX_TOKENS = 1024
+
+
+def _is_reasoning_model(model: str) -> bool:
+    # Reasoning models (e.g., o3, o4) accept `reasoning_effort`
+    return "o3" in model or "o4" in model
+
 
 class AzureOpenAIProvider(BaseLLMProvider):
     """LLM provider for Azure OpenAI Service (multi-deployment support)."""
 
-    def __init__(self):
+    def __init__(self, http_client: httpx.AsyncClient | None = None):
         self.default_model = os.getenv("AZURE_OPENAI_DEPLOYMENT", "gpt-4o-mini")
         self.api_key = os.getenv("AZURE_OPENAI_API_KEY")
+        self.http_client = http_client  # None = shared pooled client from openai_client
 
         if not self.api_key:
             raise ValueError("Missing Azure OpenAI API key in environment variables.")
 
+        self._headers = build_headers(self.api_key)  # built once, reused for every call
+        # Deployment URLs frozen from the current endpoint; fails fast instead of calling "None/openai/..."
+        self._endpoints = build_azure_url_lookup(os.getenv("AZURE_OPENAI_ENDPOINT"))
+        self._route_cache: dict[str, tuple[str, dict]] = {}
+        # Per-model payload skeletons: each request copies one and fills in the variable fields
+        self._skeletons: dict[str, dict] = {
+            model: {
+                "max_completion_tokens": _DEFAULT_MAX_TOKENS,
+                "model": model,
+                **({"reasoning_effort": "auto"} if _is_reasoning_model(model) else {}),
+            }
+            for model in self._endpoints
+        }
+
         logger.info(f"[AzureOpenAIProvider] Initialized [default_model={self.default_model}]")
 
     # ---- Core Chat Interface ----
@@ -27,66 +52,137 @@ class AzureOpenAIProvider(BaseLLMProvider):
         messages: list[dict],
         system_prompt: str = None,
         stop_sequences: list[str] = None,
-        max_tokens: int = 1024,
+        max_tokens: int = _DEFAULT_MAX_TOKENS,
         reasoning_effort: str = "auto",
         model: str = None,
+        response_format: dict | None = None,
     ) -> str:
-        """Generate response from Azure OpenAI."""
+        """
+        Generate response from Azure OpenAI.
+        `response_format` is passed through as-is, e.g. {"type": "json_object"} or a json_schema spec.
+        """
         model = model or self.default_model
-        endpoint = azure_url_lookup.get(model)
+        endpoint, payload = self._build_request(
+            messages, system_prompt, stop_sequences, max_tokens, reasoning_effort, model, response_format
+        )
+        headers = self._route(model)[1]
 
-        if not endpoint:
-            logger.error(f"[AzureOpenAIProvider] No endpoint found for model: {model}")
-            raise ValueError(f"Azure endpoint not found for model: {model}")
+        logger.info("[AzureOpenAIProvider] Calling model=%s [endpoint=%s]", model, endpoint)
 
-        if system_prompt:
-            messages = [{"role": "system", "content": system_prompt}] + messages
+        try:
+            result = await post_openai_chat(
+                endpoint, self.api_key, payload, client=self.http_client, headers=headers
+            )
+            logger.info("[AzureOpenAIProvider] Azure OpenAI call succeeded [model=%s]", model)
+            return result
 
-        payload = {
-            "messages": messages,
-            "max_completion_tokens": max_tokens,
-            "model": model,
-        }
+        except Exception as e:
+            # Lazy %-args; the traceback is only formatted when DEBUG is enabled
+            logger.error("[AzureOpenAIProvider] Azure OpenAI call failed [model=%s | error=%s]", model, e)
+            logger.debug("[AzureOpenAIProvider] generate() trace", exc_info=True)
+            raise
 
-        # Support for reasoning models (e.g., o3, o4)
-        if "o3" in model or "o4" in model:
-            payload["reasoning_effort"] = reasoning_effort
-        if stop_sequences:
-            payload["stop"] = stop_sequences
+    # ---- Streaming Interface ----
+    async def astream(self, prompt: str, model: str = None) -> AsyncIterator[str]:
+        """
+        Stream a one-shot prompt reply.
+        Deltas are coalesced to LLM_STREAM_FLUSH_MS boundaries to limit framing overhead.
+        """
+        model = model or self.default_model
+        endpoint, payload = self._build_request(
+            [{"role": "user", "content": prompt}], None, None, _DEFAULT_MAX_TOKENS, "auto", model
+        )
+
+        headers = self._route(model)[1]
 
-        logger.info(f"[AzureOpenAIProvider] Calling model={model} [endpoint={endpoint}]")
+        logger.info("[AzureOpenAIProvider] Streaming model=%s [endpoint=%s]", model, endpoint)
 
         try:
-            result = await post_openai_chat(endpoint, self.api_key, payload)
-            logger.info(f"[AzureOpenAIProvider] Azure OpenAI call succeeded [model={model}]")
-            return result
+            chunks = stream_openai_chat(
+                endpoint, self.api_key, payload, client=self.http_client, headers=headers
+            )
+            async for text in coalesce_stream(chunks, CurrentConfig.LLM_STREAM_FLUSH_MS):
+                yield text
+            logger.info("[AzureOpenAIProvider] Azure OpenAI stream completed [model=%s]", model)
 
         except Exception as e:
-            logger.error(
-                f"[AzureOpenAIProvider] Azure OpenAI call failed [model={model} | error={str(e)}]"
-            )
-            logger.debug(traceback.format_exc())
+            logger.error("[AzureOpenAIProvider] Azure OpenAI stream failed [model=%s | error=%s]", model, e)
+            logger.debug("[AzureOpenAIProvider] astream() trace", exc_info=True)
             raise
 
+    # ---- Internal helpers ----
+    def _route(self, model: str) -> tuple[str, dict]:
+        """Resolved (url, headers) for a model, composed once per model."""
+        route = self._route_cache.get(model)
+        if route is None:
+            endpoint = self._endpoints.get(model)
+            if not endpoint:
+                logger.error(f"[AzureOpenAIProvider] No endpoint found for model: {model}")
+                raise ValueError(f"Azure endpoint not found for model: {model}")
+            route = self._route_cache[model] = (endpoint, self._headers)
+        return route
+
+    def _build_request(
+        self,
+        messages: list[dict],
+        system_prompt: str | None,
+        stop_sequences: list[str] | None,
+        max_tokens: int,
+        reasoning_effort: str,
+        model: str,
+        response_format: dict | None = None,
+    ) -> tuple[str, dict]:
+        """Resolve the deployment endpoint and build the chat-completions payload."""
+        endpoint = self._route(model)[0]
+
+        payload = self._skeletons[model].copy()
+        # Caller's list is sent as-is unless a system prompt has to be prepended
+        payload["messages"] = [{"role": "system", "content": system_prompt}, *messages] if system_prompt else messages
+        if max_tokens != _DEFAULT_MAX_TOKENS:
+            payload["max_completion_tokens"] = max_tokens
+        if reasoning_effort != "auto" and "reasoning_effort" in payload:
+            payload["reasoning_effort"] = reasoning_effort
+        if stop_sequences:
+            payload["stop"] = stop_sequences
+        if response_format:
+            payload["response_format"] = response_format
+
+        return endpoint, payload
+
     # ---- Lightweight alias for agents ----
-    async def apredict(self, prompt: str, model: str = None) -> str:
+    async def apredict(self, prompt: str, model: str = None, response_format: dict = None) -> str:
         """
         Async predict helper for simple one-shot text prompts.
         Used by agents like HelloAgent.
         """
         try:
             model = model or self.default_model
-            logger.info(
-                f"[AzureOpenAIProvider] apredict() called [model={model} | prompt_preview={prompt[:80]}]"
-            )
+            # %.80s truncates the preview only when the record is actually emitted
+            logger.info("[AzureOpenAIProvider] apredict() called [model=%s | prompt_preview=%.80s]", model, prompt)
 
-            messages = [{"role": "user", "content": prompt}]
-            result = await self.generate(messages=messages, model=model)
+            if _is_reasoning_model(model):
+                # Reasoning models need reasoning_effort: keep the general path
+                messages = [{"role": "user", "content": prompt}]
+                result = await self.generate(messages=messages, model=model, response_format=response_format)
+            else:
+                result = await self._apredict_fast(prompt, model, response_format)
 
-            logger.info(f"[AzureOpenAIProvider] apredict() succeeded [model={model}]")
+            logger.info("[AzureOpenAIProvider] apredict() succeeded [model=%s]", model)
             return result
 
         except Exception as e:
-            logger.error(f"[AzureOpenAIProvider] apredict() failed [error={str(e)}]")
-            logger.debug(traceback.format_exc())
+            logger.error("[AzureOpenAIProvider] apredict() failed [error=%s]", e)
+            logger.debug("[AzureOpenAIProvider] apredict() trace", exc_info=True)
             raise
+
+    async def _apredict_fast(self, prompt: str, model: str, response_format: dict | None = None) -> str:
+        """
+        Specialized single-prompt path (no system prompt / stop / reasoning options):
+        builds the payload directly and posts it, skipping generate()'s option checks.
+        """
+        endpoint, headers = self._route(model)
+        payload = self._skeletons[model].copy()
+        payload["messages"] = [{"role": "user", "content": prompt}]
+        if response_format:
+            payload["response_format"] = response_format
+        return await post_openai_chat(endpoint, self.api_key, payload, client=self.http_client, headers=headers)
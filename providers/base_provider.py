@@ -1,5 +1,6 @@
 # src/providers/base_provider.py
 from abc import ABC, abstractmethod
+from typing import AsyncIterator
 
 class BaseLLMProvider(ABC):
     """Abstract base class for all LLM providers."""
@@ -8,3 +9,18 @@ class BaseLLMProvider(ABC):
     async def generate(self, *args, **kwargs) -> str:
         """Generate a response from the LLM."""
         pass
+
+    async def apredict(self, prompt: str, model: str = None, response_format: dict = None) -> str:
+        """
+        One-shot text prompt helper built on top of `generate`.
+        `response_format` requests structured output (e.g. a JSON schema) from providers that support it.
+        """
+        kwargs = {"response_format": response_format} if response_format else {}
+        return await self.generate(messages=[{"role": "user", "content": prompt}], model=model, **kwargs)
+
+    async def astream(self, prompt: str, model: str = None) -> AsyncIterator[str]:
+        """
+        Stream a one-shot prompt as text chunks.
+        Default implementation yields the full `apredict` reply as a single chunk.
+        """
+        yield await self.apredict(prompt, model=model)
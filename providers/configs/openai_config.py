@@ -1,8 +1,24 @@
 # src/providers/configs/openai_config.py
 import os
 
-# Azure OpenAI endpoints mapped by model name
-azure_url_lookup = {
-    "gpt-4o": f"{os.getenv('AZURE_OPENAI_ENDPOINT')}/openai/deployments/gpt-4o/chat/completions?api-version=2025-01-01-preview",
-    "gpt-4.1-mini": f"{os.getenv('AZURE_OPENAI_ENDPOINT')}/openai/deployments/gpt-4.1-mini/chat/completions?api-version=2025-01-01-preview",
-}
+_API_VERSION = "2025-01-01-preview"
+
+# Deployments exposed through Azure OpenAI (model name == deployment name)
+AZURE_DEPLOYMENTS = ("gpt-4o", "gpt-4.1-mini")
+
+
+def build_azure_url_lookup(endpoint: str | None) -> dict[str, str]:
+    """Map model name -> chat-completions URL for the given Azure OpenAI endpoint."""
+    if not endpoint:
+        raise ValueError("Missing AZURE_OPENAI_ENDPOINT; cannot build Azure OpenAI deployment URLs.")
+    endpoint = endpoint.rstrip("/")
+    return {
+        model: f"{endpoint}/openai/deployments/{model}/chat/completions?api-version={_API_VERSION}"
+        for model in AZURE_DEPLOYMENTS
+    }
+
+
+# Azure OpenAI endpoints mapped by model name, resolved at import (empty if the endpoint is unset).
+# AzureOpenAIProvider builds its own snapshot at init via build_azure_url_lookup().
+_endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
+azure_url_lookup = build_azure_url_lookup(_endpoint) if _endpoint else {}
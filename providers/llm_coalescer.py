@@ -0,0 +1,46 @@
+# providers/llm_coalescer.py
+import asyncio
+from typing import Dict
+from core.logger import get_logger
+
+logger = get_logger("LLMCoalescer")
+
+
+class LLMCoalescer:
+    """
+    Single-flight coalescer for one-shot LLM prompts.
+    Azure chat completions has no multi-prompt endpoint, so nothing is batched on the
+    wire; instead, concurrent callers of an identical prompt share the one in-flight
+    `apredict` call. A prompt with nothing in flight goes straight to the provider,
+    with no queue or dispatcher hop.
+    """
+
+    def __init__(self, llm=None):
+        self._llm = llm
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    @property
+    def llm(self):
+        """Resolve the LLM provider lazily so importing the coalescer stays cheap."""
+        if self._llm is None:
+            from providers.llm_service_provider import get_llm_service
+            self._llm = get_llm_service()
+        return self._llm
+
+    async def submit(self, prompt: str) -> str:
+        """
+        Return the completion for `prompt`, joining an identical call already in flight.
+        Cancelling one caller does not cancel the shared call for the others.
+        """
+        task = self._inflight.get(prompt)
+        if task is None:
+            task = asyncio.ensure_future(self.llm.apredict(prompt))
+            self._inflight[prompt] = task
+            task.add_done_callback(lambda _, prompt=prompt: self._inflight.pop(prompt, None))
+        return await asyncio.shield(task)
+
+    async def drain(self):
+        """Wait for in-flight calls to finish (called from the FastAPI lifespan on shutdown)."""
+        if self._inflight:
+            await asyncio.gather(*self._inflight.values(), return_exceptions=True)
+        logger.info("[LLMCoalescer] Drained.")
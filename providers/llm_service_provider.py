@@ -1,14 +1,21 @@
 # providers/llm_service_provider.py
+#
+# Event loop: every LLM-bound path (orchestrator, reflection, clarification) is asyncio I/O
+# over httpx, so it runs best on uvloop (libuv); `main.py` asks uvicorn for it (`loop="uvloop"`).
 import os
-from functools import lru_cache
+import hashlib
+from core.singleton import singleton
 from providers.azure_openai_provider import AzureOpenAIProvider
+from providers.llm_coalescer import LLMCoalescer
+from core.cache import TTLCache
+from core.config import CurrentConfig
 from core.logger import get_logger, log_error
 from core.exceptions import MCPRuntimeError
 
 logger = get_logger("LLMServiceProvider")
 
 
-@lru_cache(maxsize=1)
+@singleton
 def get_llm_service():
     """
     Global singleton provider for the LLM service.
@@ -19,7 +26,7 @@ def get_llm_service():
 
     try:
         if provider_name == "azure":
-            service = AzureOpenAIProvider()
+            service = AzureOpenAIProvider()  # uses the shared pooled HTTP client
             logger.info("Azure OpenAI LLM provider initialized successfully.")
             return service
 
@@ -32,3 +39,26 @@ def get_llm_service():
     except Exception as e:
         log_error("Failed to initialize LLM provider.", provider=provider_name, error=str(e))
         raise MCPRuntimeError(f"Failed to initialize LLM provider '{provider_name}'") from e
+
+
+@singleton
+def get_llm_coalescer() -> LLMCoalescer:
+    """
+    Global request coalescer: concurrent identical prompts share one LLM call.
+    Drained by the FastAPI lifespan on shutdown.
+    """
+    return LLMCoalescer()
+
+
+@singleton
+def get_llm_cache() -> TTLCache:
+    """
+    Global response cache for idempotent one-shot prompts.
+    Sized and expired via LLM_CACHE_SIZE / LLM_CACHE_TTL (size 0 disables caching).
+    """
+    return TTLCache(maxsize=CurrentConfig.LLM_CACHE_SIZE, ttl=CurrentConfig.LLM_CACHE_TTL)
+
+
+def llm_cache_key(prompt: str) -> str:
+    """Stable, fixed-size cache key for a prompt."""
+    return hashlib.sha1(prompt.encode("utf-8")).hexdigest()
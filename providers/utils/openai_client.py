@@ -1,27 +1,140 @@
 # providers/utils/openai_client.py
 import httpx
-from core.logger import get_logger, log_info, log_error, log_debug
+import orjson
+from contextlib import AsyncExitStack
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import AsyncIterator
+from tenacity import AsyncRetrying, RetryCallState, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+from core.config import CurrentConfig
+from core.logger import get_logger, log_info, log_error, log_debug, log_warning
 
 logger = get_logger("OpenAIClient")
 
-async def post_openai_chat(url: str, api_key: str, payload: dict) -> str:
-    """Send a chat completion request to Azure OpenAI."""
-    headers = {
+# Process-wide pooled client (HTTP/2 + keep-alive), created on first use and closed on shutdown
+_shared_client: httpx.AsyncClient | None = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the shared LLM HTTP client, so TCP/TLS connections are reused across calls."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        # Pool settings live on the transport, which also retries failed connects
+        transport = httpx.AsyncHTTPTransport(
+            http2=CurrentConfig.LLM_HTTP2,
+            retries=CurrentConfig.LLM_HTTP_RETRIES,
+            limits=httpx.Limits(
+                max_connections=CurrentConfig.LLM_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=CurrentConfig.LLM_HTTP_MAX_KEEPALIVE,
+            ),
+        )
+        _shared_client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(CurrentConfig.LLM_HTTP_TIMEOUT, connect=CurrentConfig.LLM_HTTP_CONNECT_TIMEOUT),
+        )
+    return _shared_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client and its pooled connections (called from the FastAPI lifespan)."""
+    global _shared_client
+    if _shared_client is not None:
+        client, _shared_client = _shared_client, None
+        await client.aclose()
+        log_info("Shared LLM HTTP client closed.")
+
+
+# ---- Retry policy (transient status codes) ----
+_RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+_MAX_RETRY_AFTER = 60.0  # seconds; never sleep longer than this on a server hint
+_backoff = wait_exponential_jitter(initial=1, max=10)
+
+
+def _is_transient(exc: BaseException) -> bool:
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code in _RETRY_STATUSES
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Server-requested delay from `retry-after-ms` (Azure) or `Retry-After` (seconds or HTTP date)."""
+    value = response.headers.get("retry-after-ms")
+    if value:
+        try:
+            return float(value) / 1000
+        except ValueError:
+            pass
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        try:
+            return (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+
+
+def _retry_wait(state: RetryCallState) -> float:
+    exc = state.outcome.exception()
+    delay = _retry_after(exc.response) if isinstance(exc, httpx.HTTPStatusError) else None
+    if delay is None:
+        return _backoff(state)
+    return min(max(delay, 0.0), _MAX_RETRY_AFTER)
+
+
+def _log_retry(state: RetryCallState) -> None:
+    log_warning(
+        "Transient OpenAI status; retrying.",
+        status=state.outcome.exception().response.status_code,
+        attempt=state.attempt_number,
+        wait=round(state.next_action.sleep, 2),
+    )
+
+
+def build_headers(api_key: str) -> dict:
+    return {
         "Content-Type": "application/json",
         "api-key": api_key,
     }
 
+
+async def post_openai_chat(
+    url: str,
+    api_key: str,
+    payload: dict,
+    client: httpx.AsyncClient | None = None,
+    headers: dict | None = None,
+) -> str:
+    """
+    Send a chat completion request to Azure OpenAI.
+    Uses the shared pooled client unless a `client` is given; callers can pass
+    prebuilt `headers` to skip rebuilding them per call.
+    """
+    client = client or get_shared_client()
+    headers = headers or build_headers(api_key)
+
     try:
         log_debug("Sending OpenAI chat request.", url=url)
 
-        async with httpx.AsyncClient(timeout=60) as client:
-            resp = await client.post(url, headers=headers, json=payload)
-            resp.raise_for_status()
-            data = resp.json()
-            content = data["choices"][0]["message"]["content"]
+        body = orjson.dumps(payload)
+        # 408/429/5xx are retried here with jittered backoff (or the server's Retry-After),
+        # so transient failures never bubble up and re-run the graph node
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception(_is_transient),
+            wait=_retry_wait,
+            stop=stop_after_attempt(CurrentConfig.LLM_HTTP_STATUS_RETRIES + 1),
+            before_sleep=_log_retry,
+            reraise=True,
+        ):
+            with attempt:
+                resp = await client.post(url, headers=headers, content=body)
+                resp.raise_for_status()
+
+        data = orjson.loads(resp.content)
+        content = data["choices"][0]["message"]["content"]
 
-            log_info("OpenAI chat response received.", status=resp.status_code)
-            return content
+        log_info("OpenAI chat response received.", status=resp.status_code)
+        return content
 
     except httpx.RequestError as e:
         log_error("OpenAI request connection failed.", url=url, error=str(e))
@@ -39,3 +152,53 @@ async def post_openai_chat(url: str, api_key: str, payload: dict) -> str:
     except Exception as e:
         log_error("Unexpected error during OpenAI chat call.", error=str(e))
         raise
+
+
+async def stream_openai_chat(
+    url: str,
+    api_key: str,
+    payload: dict,
+    client: httpx.AsyncClient | None = None,
+    headers: dict | None = None,
+) -> AsyncIterator[str]:
+    """
+    Stream a chat completion from Azure OpenAI (server-sent events).
+    Yields content deltas as they arrive; same client/header semantics as `post_openai_chat`.
+    """
+    client = client or get_shared_client()
+    headers = headers or build_headers(api_key)
+    payload = {**payload, "stream": True}
+
+    try:
+        log_debug("Sending OpenAI streaming chat request.", url=url)
+
+        async with AsyncExitStack() as stack:
+            resp = await stack.enter_async_context(client.stream("POST", url, headers=headers, content=orjson.dumps(payload)))
+            if resp.is_error:
+                await resp.aread()  # load body so the error log below can include it
+            resp.raise_for_status()
+            log_info("OpenAI chat stream opened.", status=resp.status_code)
+
+            async for line in resp.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                choices = orjson.loads(data).get("choices") or []
+                delta = choices[0].get("delta", {}).get("content") if choices else None
+                if delta:
+                    yield delta
+
+    except httpx.RequestError as e:
+        log_error("OpenAI streaming request connection failed.", url=url, error=str(e))
+        raise
+
+    except httpx.HTTPStatusError as e:
+        log_error(
+            "OpenAI returned non-200 status.",
+            url=url,
+            status=e.response.status_code,
+            body=e.response.text,
+        )
+        raise
@@ -0,0 +1,31 @@
+# providers/utils/streaming.py
+import asyncio
+from typing import AsyncIterator, List
+
+
+async def coalesce_stream(chunks: AsyncIterator[str], interval_ms: float) -> AsyncIterator[str]:
+    """
+    Merge small text chunks into larger ones emitted at most every `interval_ms`.
+    Token-sized SSE frames make per-chunk framing overhead dominate; this keeps
+    first-token latency low while bounding the number of frames sent downstream.
+    """
+    if interval_ms <= 0:
+        async for chunk in chunks:
+            yield chunk
+        return
+
+    loop = asyncio.get_running_loop()
+    interval = interval_ms / 1000
+    buffer: List[str] = []
+    last_flush = None  # first chunk is always flushed immediately
+
+    async for chunk in chunks:
+        buffer.append(chunk)
+        now = loop.time()
+        if last_flush is None or now - last_flush >= interval:
+            yield "".join(buffer)
+            buffer.clear()
+            last_flush = now
+
+    if buffer:
+        yield "".join(buffer)
@@ -0,0 +1,11 @@
+# tests/conftest.py
+import os
+import sys
+
+# Tests import the framework packages (core, memory, orchestrator, ...) from the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Placeholder credentials so app modules (which build the LLM provider at import) load in tests;
+# tests never reach the network
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test-key")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "http://azure.invalid")
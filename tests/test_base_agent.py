@@ -0,0 +1,58 @@
+# tests/test_base_agent.py
+import pytest
+
+from core.base_agent import BaseAgent
+from core.exceptions import ToolError
+
+
+class EchoTool:
+    def __init__(self, name, tag=None):
+        self.name = name
+        self.tag = tag or name
+
+    def execute(self, **kwargs):
+        return self.tag
+
+
+class Agent(BaseAgent):
+    def run(self, query, state):
+        return {}
+
+
+def test_use_tool_by_name_and_instance():
+    tool = EchoTool("a")
+    agent = Agent(tools=[tool, EchoTool("b")])
+    assert agent.use_tool("b") == "b"
+    assert agent.use_tool(tool) == "a"
+    with pytest.raises(ToolError):
+        agent.use_tool("missing")
+
+
+def test_in_place_edits_to_tools_are_kept():
+    agent = Agent()
+    agent.tools.append(EchoTool("a"))
+    assert [t.name for t in agent.tools] == ["a"]
+    assert agent.use_tool("a") == "a"
+
+    agent.tools[0] = EchoTool("b")
+    agent.tools.extend([EchoTool("c")])
+    assert agent.use_tool("b") == "b"
+    assert agent.use_tool("c") == "c"
+    with pytest.raises(ToolError):
+        agent.use_tool("a")
+
+    agent.tools.remove(agent.tools[0])
+    with pytest.raises(ToolError):
+        agent.use_tool("b")
+
+
+def test_tools_is_a_list_and_can_be_reassigned():
+    agent = Agent(tools=[EchoTool("a")])
+    assert isinstance(agent.tools, list)
+    agent.tools = [EchoTool("z")]
+    assert agent.use_tool("z") == "z"
+
+
+def test_duplicate_names_resolve_to_first_tool():
+    agent = Agent(tools=[EchoTool("a", "first"), EchoTool("a", "second")])
+    assert agent.use_tool("a") == "first"
@@ -0,0 +1,48 @@
+# tests/test_base_tool.py
+import asyncio
+
+from core.base_tool import BaseTool
+
+
+class ModeTool(BaseTool):
+    name = "ModeTool"
+
+    def execute(self, **kwargs):
+        return "sync"
+
+    async def aexecute(self, **kwargs):
+        return "async"
+
+
+class AsyncModeTool(ModeTool):
+    async_supported = True
+
+
+class SyncAexecuteTool(BaseTool):
+    name = "SyncAexecuteTool"
+    async_supported = True
+
+    def execute(self, **kwargs):
+        return "sync"
+
+    def aexecute(self, **kwargs):  # not a coroutine function: never awaited
+        return "not awaited"
+
+
+def test_class_level_async_supported_selects_the_mode():
+    assert asyncio.run(ModeTool().safe_execute()) == "sync"
+    assert asyncio.run(AsyncModeTool().safe_execute()) == "async"
+
+
+def test_instance_level_async_supported_is_respected():
+    tool = ModeTool()
+    tool.async_supported = True
+    assert asyncio.run(tool.safe_execute()) == "async"
+
+    tool = AsyncModeTool()
+    tool.async_supported = False
+    assert asyncio.run(tool.safe_execute()) == "sync"
+
+
+def test_sync_aexecute_falls_back_to_execute():
+    assert asyncio.run(SyncAexecuteTool().safe_execute()) == "sync"
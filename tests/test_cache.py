@@ -0,0 +1,69 @@
+# tests/test_cache.py
+import pytest
+
+import core.cache as cache_module
+from core.cache import TTLCache
+from providers.llm_service_provider import llm_cache_key
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_set_and_default():
+    cache = TTLCache(maxsize=4)
+    assert cache.get("missing") is None
+    assert cache.get("missing", "dflt") == "dflt"
+    cache.set("k", "v")
+    assert cache.get("k") == "v" and len(cache) == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.set("k", "v")
+    clock[0] += 59
+    assert cache.get("k") == "v"
+    clock[0] += 2
+    assert cache.get("k") is None
+    assert len(cache) == 0  # expired entry is dropped on read
+
+
+def test_zero_ttl_never_expires(clock):
+    cache = TTLCache(maxsize=4, ttl=0)
+    cache.set("k", "v")
+    clock[0] += 10 ** 6
+    assert cache.get("k") == "v"
+
+
+def test_zero_maxsize_disables_caching():
+    cache = TTLCache(maxsize=0)
+    cache.set("k", "v")
+    assert cache.get("k") is None and len(cache) == 0
+
+
+def test_overwrite_refreshes_value_and_expiry(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("k", 1)
+    clock[0] += 8
+    cache.set("k", 2)
+    clock[0] += 8
+    assert cache.get("k") == 2
+
+
+def test_prompt_cache_key_is_stable_and_fixed_size():
+    assert llm_cache_key("hello") == llm_cache_key("hello")
+    assert llm_cache_key("hello") != llm_cache_key("hello ")
+    assert len(llm_cache_key("x" * 10000)) == 40
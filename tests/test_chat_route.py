@@ -0,0 +1,48 @@
+# tests/test_chat_route.py
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+import main
+
+
+class PydanticChatRequest(BaseModel):
+    """The Pydantic model ChatRequest replaced; its 422 body is the contract clients parse."""
+    query: str
+    session_id: str | None = None
+    domain: str | None = None
+
+
+_reference = FastAPI()
+
+
+@_reference.post("/chat/")
+async def _reference_chat(request: PydanticChatRequest):
+    return {}
+
+
+INVALID_BODIES = [
+    b'{"session_id": "s1"}',             # missing field
+    b'{"query": 1}',                     # wrong type
+    b'{"query": "hi", "session_id": 2}', # wrong type on an optional field
+    b'[1, 2]',                           # not an object
+    b'"hello"',
+    b'',                                 # no body
+]
+
+
+@pytest.mark.parametrize("body", INVALID_BODIES)
+def test_invalid_body_matches_fastapi_validation_detail(body):
+    headers = {"content-type": "application/json"}
+    got = TestClient(main.app).post("/chat/", content=body, headers=headers)
+    expected = TestClient(_reference).post("/chat/", content=body, headers=headers)
+    assert got.status_code == expected.status_code == 422
+    assert got.json() == expected.json()
+
+
+def test_malformed_json_reports_json_invalid():
+    got = TestClient(main.app).post("/chat/stream", content=b'{bad', headers={"content-type": "application/json"})
+    assert got.status_code == 422
+    [error] = got.json()["detail"]
+    assert (error["type"], error["loc"], error["msg"]) == ("json_invalid", ["body", 1], "JSON decode error")
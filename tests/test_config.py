@@ -0,0 +1,42 @@
+# tests/test_config.py
+import subprocess
+import sys
+from pathlib import Path
+
+from core.config import BaseConfig, DevConfig, ProdConfig
+
+
+def _public_keys(cls):
+    # What as_dict() listed before the key cache: a dir() scan for upper-case names
+    return [k for k in dir(cls) if k.isupper() and not k.startswith("_")]
+
+
+def test_as_dict_keys_match_public_settings():
+    for cls in (BaseConfig, DevConfig, ProdConfig):
+        assert list(cls.as_dict()) == _public_keys(cls)
+        assert "_CONFIG_KEYS" not in cls.as_dict()
+        assert "_CONFIG_KEYS" not in cls.summary()
+
+
+def test_subclass_settings_are_collected():
+    class CustomConfig(DevConfig):
+        EXTRA_FLAG = True
+        _PRIVATE = 1
+
+    keys = CustomConfig.as_dict()
+    assert keys["EXTRA_FLAG"] is True
+    assert keys["LOG_LEVEL"] == "DEBUG"
+    assert "_PRIVATE" not in keys
+
+
+def test_import_does_not_load_dotenv():
+    code = (
+        "import core.config as c\n"
+        "assert not c._dotenv_loaded\n"
+        "cfg = c.CurrentConfig\n"
+        "assert c._dotenv_loaded and cfg in (c.DevConfig, c.ProdConfig)\n"
+        "from core.config import CurrentConfig\n"
+        "assert CurrentConfig is cfg\n"
+    )
+    root = Path(__file__).resolve().parent.parent
+    subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
@@ -0,0 +1,40 @@
+# tests/test_greeting_node.py
+import asyncio
+
+from nodes.greeting_node import GreetingNode
+
+
+class FakeAgent:
+    def __init__(self, result=None, error=None):
+        self.result = result or {}
+        self.error = error
+
+    async def run(self, query, state):
+        if self.error:
+            raise self.error
+        return self.result
+
+
+def test_success_merges_agent_output_into_state():
+    agent = FakeAgent({"reply": None, "timestamp": None, "llm_used": True})
+    state = {"query": " hello ", "session_id": "s1"}
+    out = asyncio.run(GreetingNode(agent=agent).execute(state))
+    assert out == {
+        "query": "hello",
+        "session_id": "s1",
+        "greeting": "Hello there 👋! Let me think about that for you...",
+        "agent_reply": None,
+        "timestamp": None,
+        "llm_used": True,
+    }
+    assert state == {"query": " hello ", "session_id": "s1"}  # input is not mutated
+
+
+def test_agent_failure_records_error():
+    out = asyncio.run(GreetingNode(agent=FakeAgent(error=RuntimeError("boom"))).execute({"query": "hey"}))
+    assert out == {
+        "query": "hey",
+        "greeting": "Hello there 👋! Let me think about that for you...",
+        "error": "boom",
+        "llm_used": False,
+    }
@@ -0,0 +1,98 @@
+# tests/test_llm_coalescer.py
+import asyncio
+
+from providers.llm_coalescer import LLMCoalescer
+
+
+class FakeLLM:
+    """Records every apredict() call; replies 'echo:<prompt>' after `delay` seconds."""
+
+    def __init__(self, delay: float = 0.0, fail_on: str = None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.calls = []
+
+    async def apredict(self, prompt, model=None):
+        self.calls.append(prompt)
+        await asyncio.sleep(self.delay)
+        if prompt == self.fail_on:
+            raise ValueError(prompt)
+        return f"echo:{prompt}"
+
+
+def test_concurrent_identical_prompts_share_one_call():
+    llm = FakeLLM(delay=0.01)
+    coalescer = LLMCoalescer(llm=llm)
+
+    async def run():
+        return await asyncio.gather(*(coalescer.submit(p) for p in ["a", "b", "a", "a"]))
+
+    assert asyncio.run(run()) == ["echo:a", "echo:b", "echo:a", "echo:a"]
+    assert llm.calls == ["a", "b"]
+    assert coalescer._inflight == {}
+
+
+def test_late_caller_joins_a_call_already_in_flight():
+    llm = FakeLLM(delay=0.05)
+    coalescer = LLMCoalescer(llm=llm)
+
+    async def run():
+        first = asyncio.create_task(coalescer.submit("a"))
+        await asyncio.sleep(0.02)  # "a" is now in flight
+        return await asyncio.gather(first, coalescer.submit("a"))
+
+    assert asyncio.run(run()) == ["echo:a", "echo:a"]
+    assert llm.calls == ["a"]
+
+
+def test_sequential_prompts_are_not_cached():
+    llm = FakeLLM()
+    coalescer = LLMCoalescer(llm=llm)
+
+    async def run():
+        return [await coalescer.submit("a"), await coalescer.submit("a")]
+
+    assert asyncio.run(run()) == ["echo:a", "echo:a"]
+    assert llm.calls == ["a", "a"]  # caching is the response cache's job, not the coalescer's
+
+
+def test_failure_reaches_every_caller_of_that_prompt_only():
+    llm = FakeLLM(fail_on="bad")
+    coalescer = LLMCoalescer(llm=llm)
+
+    async def run():
+        return await asyncio.gather(
+            coalescer.submit("bad"), coalescer.submit("bad"), coalescer.submit("ok"), return_exceptions=True,
+        )
+
+    bad1, bad2, ok = asyncio.run(run())
+    assert isinstance(bad1, ValueError) and isinstance(bad2, ValueError) and ok == "echo:ok"
+    assert coalescer._inflight == {}
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_call():
+    llm = FakeLLM(delay=0.05)
+    coalescer = LLMCoalescer(llm=llm)
+
+    async def run():
+        cancelled = asyncio.create_task(coalescer.submit("x"))
+        kept = asyncio.create_task(coalescer.submit("x"))
+        await asyncio.sleep(0.01)  # call is in flight
+        cancelled.cancel()
+        return await kept, cancelled.cancelled()
+
+    assert asyncio.run(run()) == ("echo:x", True)
+    assert llm.calls == ["x"]
+
+
+def test_drain_waits_for_in_flight_calls():
+    llm = FakeLLM(delay=0.05)
+    coalescer = LLMCoalescer(llm=llm)
+
+    async def run():
+        pending = asyncio.create_task(coalescer.submit("late"))
+        await asyncio.sleep(0.01)
+        await coalescer.drain()
+        return coalescer._inflight, llm.calls
+
+    assert asyncio.run(run()) == ({}, ["late"])
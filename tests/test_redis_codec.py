@@ -0,0 +1,65 @@
+import msgpack
+import orjson
+import pytest
+
+from memory.redis_memory import RedisMemory, _MSGPACK, _MSGPACK_ZSTD
+
+
+STATE = {
+    "session_id": "s1",
+    "messages": [{"role": "human", "content": "héllo"}, {"role": "assistant", "content": "hi"}],
+    "turn": 3,
+    "score": 0.5,
+    "done": False,
+    "meta": None,
+}
+
+
+@pytest.fixture
+def mem():
+    # The connection pool connects lazily, so no Redis server is needed for the codec
+    return RedisMemory()
+
+
+def test_round_trip_uses_msgpack_marker(mem):
+    raw = mem._encode(STATE)
+    assert raw[:1] == _MSGPACK
+    assert msgpack.unpackb(raw[1:], raw=False) == STATE
+    assert mem._decode(raw) == STATE
+
+
+def test_round_trip_scalars_and_lists(mem):
+    for obj in ([], [1, "two", 3.0], "text", 42, {}):
+        assert mem._decode(mem._encode(obj)) == obj
+
+
+def test_legacy_json_entries_still_decode(mem):
+    legacy = orjson.dumps(STATE)
+    assert legacy[:1] == b"{"
+    assert mem._decode(legacy) == STATE
+
+
+def _large_state():
+    return {**STATE, "messages": [{"role": "human", "content": "x" * 200}] * 50}
+
+
+def test_large_payload_is_zstd_compressed(mem):
+    mem.compress_threshold = 1024
+    state = _large_state()
+    raw = mem._encode(state)
+    assert raw[:1] == _MSGPACK_ZSTD
+    assert len(raw) < len(msgpack.packb(state, use_bin_type=True))
+    assert mem._decode(raw) == state
+
+
+def test_payload_below_threshold_is_not_compressed(mem):
+    mem.compress_threshold = 1024
+    assert mem._encode(STATE)[:1] == _MSGPACK
+
+
+def test_zero_threshold_disables_compression(mem):
+    mem.compress_threshold = 0
+    state = _large_state()
+    raw = mem._encode(state)
+    assert raw[:1] == _MSGPACK
+    assert mem._decode(raw) == state
@@ -0,0 +1,49 @@
+# tests/test_reflection_heuristic.py
+import pytest
+
+from orchestrator.reflection_node import _REFUSAL_RE, _local_score
+
+QUERY = "how do I reset my router password"
+ON_TOPIC = "To reset my router password, press and hold reset on the router."
+
+
+@pytest.mark.parametrize("phrase", [
+    "I'm unable to help",
+    "I’m unable to help",
+    "I am unable to help",
+    "I cannot help",
+    "I can't help",
+    "I can’t help",
+    "I cant help",
+    "I can not help",
+    "I don't know",
+    "I don’t know",
+    "I dont know",
+    "i CANNOT help",
+])
+def test_refusal_phrasings_are_never_locally_accepted(phrase):
+    assert _REFUSAL_RE.search(phrase)
+    # Repeats enough query words to pass the overlap check: only the refusal check can reject it
+    answer = f"{phrase} with how to reset my router password, sorry."
+    assert _local_score(QUERY, answer) is None
+
+
+@pytest.mark.parametrize("text", ["I can help with that", "I cancelled it", "Hi, I know the answer"])
+def test_non_refusals_do_not_match(text):
+    assert not _REFUSAL_RE.search(text)
+
+
+def test_on_topic_answer_is_accepted():
+    assert _local_score(QUERY, ON_TOPIC) == pytest.approx(0.95)
+
+
+def test_short_answer_falls_through():
+    assert _local_score(QUERY, "reset it") is None
+
+
+def test_off_topic_answer_falls_through():
+    assert _local_score(QUERY, "Paris is the capital of France and sits on the river Seine.") is None
+
+
+def test_empty_query_falls_through():
+    assert _local_score("", ON_TOPIC) is None
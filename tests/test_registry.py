@@ -0,0 +1,88 @@
+# tests/test_registry.py
+import asyncio
+import gc
+import pytest
+
+from core.config import CurrentConfig
+from core.memory_interface import MemoryInterface
+from core.registry import MemoryRegistry
+from orchestrator.state_manager import StateManager
+
+
+class DummyMemory(MemoryInterface):
+    closed = 0
+
+    async def load_state(self, session_id):
+        return {}
+
+    async def save_state(self, session_id, state):
+        pass
+
+    async def clear_state(self, session_id):
+        pass
+
+    async def append_message(self, session_id, role, content, metadata=None):
+        pass
+
+    async def get_messages(self, session_id, limit=10):
+        return []
+
+    async def aclose(self):
+        DummyMemory.closed += 1
+
+
+@pytest.fixture
+def dummy_backend(monkeypatch):
+    MemoryRegistry.clear()
+    MemoryRegistry.register("dummy", DummyMemory)
+    monkeypatch.setattr(CurrentConfig, "MEMORY_TYPE", "dummy")
+    DummyMemory.closed = 0
+    yield
+    MemoryRegistry.clear()
+
+
+def test_active_memory_is_shared_within_a_loop_and_separate_across_loops(dummy_backend):
+    async def get_twice():
+        return MemoryRegistry.get_active_memory(), MemoryRegistry.get_active_memory()
+
+    a1, a2 = asyncio.run(get_twice())
+    b1, b2 = asyncio.run(get_twice())
+    assert a1 is a2 and b1 is b2
+    assert a1 is not b1
+
+
+def test_aclose_active_closes_the_current_loop_backend(dummy_backend):
+    async def run():
+        first = MemoryRegistry.get_active_memory()
+        await MemoryRegistry.aclose_active()
+        return first, MemoryRegistry.get_active_memory()
+
+    first, rebuilt = asyncio.run(run())
+    assert DummyMemory.closed == 1
+    assert rebuilt is not first
+
+
+def test_active_memory_outside_a_loop(dummy_backend):
+    assert MemoryRegistry.get_active_memory() is MemoryRegistry.get_active_memory()
+
+
+def test_state_manager_uses_the_running_loop_backend(dummy_backend):
+    sm = StateManager()  # built outside any loop, like the app's import-time orchestrator
+
+    async def backend():
+        assert sm.memory is MemoryRegistry.get_active_memory()
+        return sm.memory
+
+    first, second = asyncio.run(backend()), asyncio.run(backend())
+    assert isinstance(first, DummyMemory)
+    assert first is not second
+    assert MemoryRegistry._active_no_loop is None  # nothing pinned at construction
+
+
+def test_backend_of_a_finished_loop_is_released(dummy_backend):
+    async def build():
+        return id(MemoryRegistry.get_active_memory())
+
+    asyncio.run(build())
+    gc.collect()
+    assert len(MemoryRegistry._active) == 0  # weak loop keys: no stale client for a reused loop id
@@ -0,0 +1,30 @@
+# tests/test_responses.py
+import warnings
+
+from fastapi import FastAPI
+from fastapi.exceptions import FastAPIDeprecationWarning
+from fastapi.testclient import TestClient
+
+import main
+from api.responses import OrjsonResponse
+
+
+def test_orjson_response_renders_json_bytes():
+    response = OrjsonResponse({"reply": "héllo 👋", "n": 1, 2: None})
+    assert response.body == '{"reply":"héllo 👋","n":1,"2":null}'.encode()
+    assert response.media_type == "application/json"
+
+
+def test_default_response_class_is_not_deprecated():
+    # The app's default class renders dict returns without FastAPI deprecation warnings
+    app = FastAPI(default_response_class=main.app.router.default_response_class)
+
+    @app.get("/reply")
+    async def reply():
+        return {"reply": "hi"}
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", FastAPIDeprecationWarning)
+        response = TestClient(app).get("/reply")
+    assert response.json() == {"reply": "hi"}
+    assert response.headers["content-type"] == "application/json"
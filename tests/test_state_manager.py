@@ -0,0 +1,212 @@
+# tests/test_state_manager.py
+import asyncio
+import logging
+import pytest
+
+from core.context import get_request_context, request_context
+from core.registry import MemoryRegistry
+from orchestrator.state_manager import StateManager
+
+
+class FakeMemory:
+    """In-memory backend recording every call (and the request context it ran under)."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.states = {}
+        self.messages = {}
+        self.vectors = []
+        self.calls = []
+        self.contexts = []
+
+    async def load_state(self, session_id):
+        return self.states.get(session_id, {})
+
+    async def save_state(self, session_id, state):
+        self.calls.append(("save_state", session_id))
+        await asyncio.sleep(self.delay)
+        self.states[session_id] = state
+
+    async def append_messages_bulk(self, session_id, messages):
+        self.calls.append(("append_messages_bulk", session_id, len(messages)))
+        self.messages.setdefault(session_id, []).extend(messages)
+
+    async def get_messages(self, session_id, limit=None):
+        msgs = self.messages.get(session_id, [])
+        return msgs[-limit:] if limit else msgs
+
+    async def store_vectors_bulk(self, entries):
+        self.contexts.append(dict(get_request_context()))
+        self.vectors.append(list(entries))
+
+
+@pytest.fixture
+def memory(monkeypatch):
+    fake = FakeMemory()
+    monkeypatch.setattr(MemoryRegistry, "get_active_memory", classmethod(lambda cls: fake))
+    return fake
+
+
+# ---- Background long-term memory (update_memory) ----
+def test_update_memory_batches_embeddings_and_writes(memory):
+    embed_calls = []
+
+    async def embedder(texts):
+        embed_calls.append(len(texts))
+        return [[float(len(t))] for t in texts]
+
+    async def run():
+        sm = StateManager(embedder=embedder)
+        for i in range(20):
+            await sm.update_memory(f"s{i % 2}", {"content": f"turn-{i}"})
+        assert memory.vectors == []  # nothing written on the request path
+        await sm.drain()
+
+    asyncio.run(run())
+    assert embed_calls == [16, 4]
+    assert [len(batch) for batch in memory.vectors] == [16, 4]
+    session_id, embedding, metadata = memory.vectors[0][0]
+    assert (session_id, embedding, metadata) == ("s0", [6.0], {"content": "turn-0"})
+
+
+def test_update_memory_without_embedder_stores_empty_embeddings(memory):
+    async def run():
+        sm = StateManager()
+        await sm.update_memory("s", {"answer": 42})
+        await sm.drain()
+
+    asyncio.run(run())
+    assert memory.vectors == [[("s", [], {"content": "{'answer': 42}"})]]
+
+
+def test_vector_worker_does_not_inherit_request_context(memory, caplog):
+    caplog.set_level(logging.DEBUG, logger="mcp")
+
+    async def run():
+        sm = StateManager()
+        # The first request lazily starts the worker; later requests share it
+        for session_id in ("first", "second", "third"):
+            with request_context(session_id=session_id, trace_id=f"trace-{session_id}"):
+                await sm.update_memory(session_id, {"content": session_id})
+        await sm.drain()
+
+    asyncio.run(run())
+    assert memory.contexts == [{}]
+    logged = [r.getMessage() for r in caplog.records if r.getMessage().startswith("Semantic memory updated.")]
+    assert sorted(logged) == sorted(
+        f"Semantic memory updated. [session_id={s} | count=1]" for s in ("first", "second", "third")
+    )
+
+
+def test_drain_all_stores_pending_vectors_and_stops_the_worker(memory):
+    async def slow_embedder(texts):
+        await asyncio.sleep(0.05)
+        return [[1.0] for _ in texts]
+
+    async def run():
+        sm = StateManager(embedder=slow_embedder)
+        for i in range(3):
+            await sm.update_memory("s", {"content": f"turn-{i}"})
+        worker = sm._vector_worker
+        await StateManager.drain_all()  # lifespan shutdown
+        others = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        return worker, others, sm
+
+    worker, others, sm = asyncio.run(run())
+    assert [len(batch) for batch in memory.vectors] == [3]  # last turns are not lost
+    assert worker.done() and others == []  # nothing left for the loop to destroy
+    assert sm not in StateManager._writers
+
+
+# ---- Write-behind (STATE_WRITE_BEHIND) ----
+@pytest.fixture
+def write_behind(memory, monkeypatch):
+    from core.config import CurrentConfig
+    monkeypatch.setattr(CurrentConfig, "STATE_WRITE_BEHIND", True)
+    return memory
+
+
+def test_write_behind_coalesces_and_keeps_message_order(write_behind):
+    memory = write_behind
+
+    async def run():
+        sm = StateManager()
+        for i in range(5):
+            await sm.save_state("a", {"turn": i})
+            await sm.append_message("a", "human", f"m{i}")
+        await sm.save_state("b", {"turn": 0})
+        assert memory.calls == []  # only queued so far
+        await sm.drain()
+
+    asyncio.run(run())
+    assert memory.states == {"a": {"turn": 4}, "b": {"turn": 0}}
+    assert [m["content"] for m in memory.messages["a"]] == [f"m{i}" for i in range(5)]
+    # One state write per session and one bulk append for the session's messages
+    assert sorted(memory.calls) == [("append_messages_bulk", "a", 5), ("save_state", "a"), ("save_state", "b")]
+
+
+def test_write_behind_reads_see_own_pending_writes(write_behind):
+    write_behind.delay = 0.02
+
+    async def run():
+        sm = StateManager()
+        await sm.save_state("a", {"v": 1})
+        await sm.append_message("a", "assistant", "hello")
+        state = await sm.load_state("a")
+        messages = await sm.get_recent_messages("a")
+        return state, messages
+
+    state, messages = asyncio.run(run())
+    assert state == {"v": 1}
+    assert [m["content"] for m in messages] == ["hello"]
+
+
+def test_write_behind_queued_state_is_a_snapshot(write_behind):
+    async def run():
+        sm = StateManager()
+        state = {"v": 1}
+        await sm.save_state("a", state)
+        state["v"] = 2  # caller mutates after save_state returned
+        await sm.drain()
+
+    asyncio.run(run())
+    assert write_behind.states["a"] == {"v": 1}
+
+
+def test_write_behind_restart_wakes_readers_of_a_dead_writer(write_behind):
+    async def run():
+        sm = StateManager()
+        await sm.save_state("a", {"v": 1})
+        sm._writer.cancel()  # writer dies before flushing "a"
+        await asyncio.sleep(0)
+
+        reader = asyncio.create_task(sm.load_state("a"))
+        await asyncio.sleep(0.01)
+        assert not reader.done()  # parked until "a" is flushed
+
+        await sm.save_state("b", {"v": 2})  # restarts the writer
+        return await asyncio.wait_for(reader, timeout=1)
+
+    assert asyncio.run(run()) == {"v": 1}
+
+
+def test_write_behind_writer_does_not_inherit_request_context(write_behind, monkeypatch):
+    contexts = []
+    original = write_behind.save_state
+
+    async def save_state(session_id, state):
+        contexts.append(dict(get_request_context()))
+        await original(session_id, state)
+
+    monkeypatch.setattr(write_behind, "save_state", save_state)
+
+    async def run():
+        sm = StateManager()
+        with request_context(session_id="first", trace_id="t1"):
+            await sm.save_state("first", {})
+        with request_context(session_id="second", trace_id="t2"):
+            await sm.save_state("second", {})
+        await sm.drain()
+
+    asyncio.run(run())
+    assert contexts == [{}, {}]